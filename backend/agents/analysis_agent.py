@@ -5,9 +5,11 @@ Analyzes collected information using AI
 
 import asyncio
 import logging
+import os
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from sqlalchemy import bindparam, case, func, select
 from sqlalchemy.orm import Session
 
 from models.collection import AnalysisResult, Sentiment
@@ -15,6 +17,35 @@ from utils.ai_client import AIClient, AnalysisRequest
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of AI analysis requests in flight at once
+ANALYSIS_CONCURRENCY = int(os.getenv("AICA_ANALYSIS_CONCURRENCY", "16"))
+
+# Dict lookup is cheaper than calling the Enum for every analyzed item
+_SENTIMENT_MAP = {sentiment.value: sentiment for sentiment in Sentiment}
+
+TITLE_MAX_LENGTH = 100
+
+
+def _title(content: str) -> str:
+    """Truncate content to a result title"""
+    if len(content) <= TITLE_MAX_LENGTH:
+        return content
+    return f"{content[:TITLE_MAX_LENGTH]}..."
+
+
+def _count_if(condition):
+    return func.sum(case((condition, 1), else_=0))
+
+
+# Built once so every summary reuses the same compiled statement
+_SUMMARY_STMT = select(
+    func.count(AnalysisResult.id).label("total"),
+    _count_if(AnalysisResult.created_at >= bindparam("since")).label("recent"),
+    _count_if(AnalysisResult.sentiment == Sentiment.POSITIVE).label("positive"),
+    _count_if(AnalysisResult.sentiment == Sentiment.NEUTRAL).label("neutral"),
+    _count_if(AnalysisResult.sentiment == Sentiment.NEGATIVE).label("negative"),
+)
+
 
 class AnalysisAgent:
     """Agent responsible for analyzing collected information"""
@@ -22,6 +53,7 @@ class AnalysisAgent:
     def __init__(self, db: Session, ai_client: AIClient):
         self.db = db
         self.ai_client = ai_client
+        self._semaphore = asyncio.Semaphore(ANALYSIS_CONCURRENCY)
 
     async def analyze_collected_data(self) -> Dict[str, int]:
         """Analyze all collected data"""
@@ -68,16 +100,7 @@ class AnalysisAgent:
             },
         ]
 
-        analyzed_count = 0
-        for data in sample_github_data:
-            try:
-                analysis = await self._analyze_single_item(data)
-                if analysis:
-                    analyzed_count += 1
-            except Exception as e:
-                logger.error(f"Failed to analyze GitHub item: {e}")
-
-        return analyzed_count
+        return await self._analyze_items(sample_github_data, "GitHub")
 
     async def _analyze_rss_data(self) -> int:
         """Analyze RSS collected data"""
@@ -97,16 +120,7 @@ class AnalysisAgent:
             },
         ]
 
-        analyzed_count = 0
-        for data in sample_rss_data:
-            try:
-                analysis = await self._analyze_single_item(data)
-                if analysis:
-                    analyzed_count += 1
-            except Exception as e:
-                logger.error(f"Failed to analyze RSS item: {e}")
-
-        return analyzed_count
+        return await self._analyze_items(sample_rss_data, "RSS")
 
     async def _analyze_web_data(self) -> int:
         """Analyze web scraped data"""
@@ -126,19 +140,27 @@ class AnalysisAgent:
             },
         ]
 
-        analyzed_count = 0
-        for data in sample_web_data:
-            try:
-                analysis = await self._analyze_single_item(data)
-                if analysis:
-                    analyzed_count += 1
-            except Exception as e:
-                logger.error(f"Failed to analyze web item: {e}")
+        return await self._analyze_items(sample_web_data, "web")
 
-        return analyzed_count
+    async def _analyze_items(self, items: List[Dict], source: str) -> int:
+        """Analyze items concurrently and persist the successful results"""
+        outcomes = await asyncio.gather(
+            *(self._analyze_single_item(data) for data in items),
+            return_exceptions=True,
+        )
+
+        results = []
+        for outcome in outcomes:
+            if isinstance(outcome, AnalysisResult):
+                results.append(outcome)
+            elif isinstance(outcome, Exception):
+                logger.error(f"Failed to analyze {source} item: {outcome}")
+
+        # The synchronous flush/commit runs off the event loop
+        return await asyncio.to_thread(self._save_results, results)
 
     async def _analyze_single_item(self, data: Dict) -> Optional[AnalysisResult]:
-        """Analyze a single item using AI"""
+        """Analyze a single item using AI (the result is not persisted)"""
         try:
             request = AnalysisRequest(
                 content=data["content"],
@@ -146,25 +168,19 @@ class AnalysisAgent:
                 context="TypeScript ecosystem analysis",
             )
 
-            analysis = await self.ai_client.analyze_content(request)
+            async with self._semaphore:
+                analysis = await self.ai_client.analyze_content(request)
 
             # Create analysis result record
             result = AnalysisResult(
                 source_id=data["source_id"],
-                title=(
-                    data["content"][:100] + "..."
-                    if len(data["content"]) > 100
-                    else data["content"]
-                ),
+                title=_title(data["content"]),
                 summary=analysis.summary,
                 key_points=analysis.key_points,
-                sentiment=Sentiment(analysis.sentiment),
+                sentiment=_SENTIMENT_MAP[analysis.sentiment],
                 relevance=analysis.relevance_score,
             )
 
-            self.db.add(result)
-            self.db.commit()
-
             logger.info(f"Analyzed item: {data['source_id']}")
             return result
 
@@ -174,6 +190,21 @@ class AnalysisAgent:
             )
             return None
 
+    def _save_results(self, results: List[AnalysisResult]) -> int:
+        """Persist analysis results in a single batch and commit once"""
+        if not results:
+            return 0
+
+        try:
+            self.db.bulk_save_objects(results)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to save {len(results)} analysis results: {e}")
+            return 0
+
+        return len(results)
+
     async def _generate_trend_analysis(self) -> None:
         """Generate trend analysis from analyzed data"""
         logger.info("Generating trend analysis...")
@@ -203,46 +234,24 @@ class AnalysisAgent:
         except Exception as e:
             logger.error(f"Trend analysis failed: {e}")
 
+    def _count_results(self):
+        """Count total, today's and per-sentiment results in one query"""
+        today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        return self.db.execute(_SUMMARY_STMT, {"since": today}).one()
+
     async def get_analysis_summary(self) -> Dict:
         """Get summary of analysis results"""
         try:
-            # Query analysis results from database
-            total_analyzed = self.db.query(AnalysisResult).count()
-            recent_analyzed = (
-                self.db.query(AnalysisResult)
-                .filter(
-                    AnalysisResult.created_at
-                    >= datetime.utcnow().replace(
-                        hour=0, minute=0, second=0, microsecond=0
-                    )
-                )
-                .count()
-            )
-
-            # Get sentiment distribution
-            positive_count = (
-                self.db.query(AnalysisResult)
-                .filter(AnalysisResult.sentiment == Sentiment.POSITIVE)
-                .count()
-            )
-            neutral_count = (
-                self.db.query(AnalysisResult)
-                .filter(AnalysisResult.sentiment == Sentiment.NEUTRAL)
-                .count()
-            )
-            negative_count = (
-                self.db.query(AnalysisResult)
-                .filter(AnalysisResult.sentiment == Sentiment.NEGATIVE)
-                .count()
-            )
+            # Run the single aggregate query off the event loop
+            counts = await asyncio.to_thread(self._count_results)
 
             return {
-                "total_analyzed": total_analyzed,
-                "recent_analyzed": recent_analyzed,
+                "total_analyzed": counts.total,
+                "recent_analyzed": counts.recent or 0,
                 "sentiment_distribution": {
-                    "positive": positive_count,
-                    "neutral": neutral_count,
-                    "negative": negative_count,
+                    "positive": counts.positive or 0,
+                    "neutral": counts.neutral or 0,
+                    "negative": counts.negative or 0,
                 },
                 "last_analysis": datetime.utcnow().isoformat(),
             }
@@ -6,37 +6,45 @@ Collects TypeScript ecosystem information from various sources
 import asyncio
 import json
 import logging
+from collections import defaultdict
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 
-import feedparser
-import requests
-from bs4 import BeautifulSoup
-from github import Github
+import aiohttp
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
 
-from models.collection import CollectionJob, CollectionType, JobStatus
+from models.automated_content import SourceDataDB
+from models.collection import (
+    CollectionCache,
+    CollectionJob,
+    CollectionType,
+    JobStatus,
+)
+from utils.concurrency import bounded_map
 from utils.github_client import GitHubClient
 from utils.rss_parser import RSSParser
 from utils.web_scraper import WebScraper
 
 logger = logging.getLogger(__name__)
 
+# Repositories queried at once, kept low to avoid GitHub's secondary rate limits
+GITHUB_CONCURRENCY = 8
 
-class CollectionAgent:
-    """Agent responsible for collecting TypeScript ecosystem information"""
+# Feeds or pages downloaded at once
+FETCH_CONCURRENCY = 8
 
-    def __init__(self, db: Session, github_token: Optional[str] = None):
-        self.db = db
-        self.github_client = GitHubClient(github_token) if github_token else None
-        self.rss_parser = RSSParser()
-        self.web_scraper = WebScraper()
+# Rows per multi-row INSERT when flushing raw collected items
+RAW_INSERT_CHUNK_SIZE = 1000
 
-        # TypeScript-related sources
-        self.sources = {
-            "github": {
-                "repos": [
+# TypeScript-related sources, shared read-only by every agent instance
+SOURCES = MappingProxyType(
+    {
+        "github": MappingProxyType(
+            {
+                "repos": (
                     "microsoft/TypeScript",
                     "facebook/react",
                     "vercel/next.js",
@@ -45,128 +53,194 @@ class CollectionAgent:
                     "solidjs/solid",
                     "remix-run/remix",
                     "withastro/astro",
-                ],
-                "keywords": ["typescript", "ts", "types", "type-safe"],
-            },
-            "rss": [
-                "https://dev.to/feed/tag/typescript",
-                "https://medium.com/feed/tag/typescript",
-                "https://zenn.dev/feed?tag=typescript",
-                "https://blog.logrocket.com/tag/typescript/feed/",
-                "https://blog.bitsrc.io/tag/typescript/feed",
-            ],
-            "web_scraping": [
-                "https://www.typescriptlang.org/news/",
-                "https://react.dev/blog",
-                "https://nextjs.org/blog",
-                "https://svelte.dev/blog",
-            ],
-        }
+                ),
+                "keywords": frozenset({"typescript", "ts", "types", "type-safe"}),
+            }
+        ),
+        "rss": (
+            "https://dev.to/feed/tag/typescript",
+            "https://medium.com/feed/tag/typescript",
+            "https://zenn.dev/feed?tag=typescript",
+            "https://blog.logrocket.com/tag/typescript/feed/",
+            "https://blog.bitsrc.io/tag/typescript/feed",
+        ),
+        "web_scraping": (
+            "https://www.typescriptlang.org/news/",
+            "https://react.dev/blog",
+            "https://nextjs.org/blog",
+            "https://svelte.dev/blog",
+        ),
+    }
+)
 
-    async def collect_all(self) -> Dict[str, int]:
-        """Collect information from all sources"""
-        results = {}
 
-        # GitHub collection
+class CollectionAgent:
+    """Agent responsible for collecting TypeScript ecosystem information"""
+
+    def __init__(self, db: Session, github_token: Optional[str] = None):
+        self.db = db
+        self.github_client = GitHubClient(github_token) if github_token else None
+        self.rss_parser = RSSParser()
+        self.web_scraper = WebScraper()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        self.sources = SOURCES
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32, limit_per_host=8, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def collect_all(self) -> Dict[str, int]:
+        """Collect information from all sources concurrently"""
+        sources = {}
         if self.github_client:
-            try:
-                github_count = await self._collect_github()
-                results["github"] = github_count
-                logger.info(f"Collected {github_count} items from GitHub")
-            except Exception as e:
-                logger.error(f"GitHub collection failed: {e}")
-                results["github"] = 0
-
-        # RSS collection
-        try:
-            rss_count = await self._collect_rss()
-            results["rss"] = rss_count
-            logger.info(f"Collected {rss_count} items from RSS feeds")
-        except Exception as e:
-            logger.error(f"RSS collection failed: {e}")
-            results["rss"] = 0
+            sources["github"] = self._collect_github()
+        sources["rss"] = self._collect_rss()
+        sources["web_scraping"] = self._collect_web_scraping()
 
-        # Web scraping collection
         try:
-            web_count = await self._collect_web_scraping()
-            results["web_scraping"] = web_count
-            logger.info(f"Collected {web_count} items from web scraping")
-        except Exception as e:
-            logger.error(f"Web scraping collection failed: {e}")
-            results["web_scraping"] = 0
+            counts = await asyncio.gather(*sources.values(), return_exceptions=True)
+        finally:
+            await self.aclose()
+
+        results = {}
+        for source, count in zip(sources, counts):
+            if isinstance(count, Exception):
+                logger.error(f"{source} collection failed: {count}")
+                results[source] = 0
+            else:
+                logger.info(f"Collected {count} items from {source}")
+                results[source] = count
 
         return results
 
     async def _collect_github(self) -> int:
         """Collect information from GitHub repositories"""
+        # The job row is written once, with its final status, after the run
         job = CollectionJob(
-            source="github", type=CollectionType.GITHUB, status=JobStatus.RUNNING
+            source="github",
+            type=CollectionType.GITHUB,
+            status=JobStatus.RUNNING,
+            started_at=datetime.utcnow(),
+            items_collected=0,
         )
-        self.db.add(job)
-        self.db.commit()
 
         try:
             items_collected = 0
-
-            for repo_name in self.sources["github"]["repos"]:
-                # Get recent commits
-                commits = await self.github_client.get_recent_commits(repo_name, days=7)
+            # Raw rows per model, local to this collector and flushed in bulk
+            raw_buffer: Dict[type, List[Dict]] = defaultdict(list)
+            repos = self.sources["github"]["repos"]
+            semaphore = asyncio.Semaphore(GITHUB_CONCURRENCY)
+            # The client re-raises fetch errors, which fail this job; only a
+            # run where every repo and endpoint succeeded moves the watermark
+            since = self._last_successful_start("github")
+
+            async def fetch_repo(repo_name: str):
+                async with semaphore:
+                    return await asyncio.gather(
+                        self.github_client.get_recent_commits(
+                            repo_name, days=7, since=since
+                        ),
+                        self.github_client.get_recent_issues(
+                            repo_name, days=7, since=since
+                        ),
+                        self.github_client.get_recent_releases(
+                            repo_name, days=30, since=since
+                        ),
+                    )
+
+            repo_data = await asyncio.gather(*(fetch_repo(repo) for repo in repos))
+
+            for repo_name, (commits, issues, releases) in zip(repos, repo_data):
                 for commit in commits:
-                    await self._process_github_commit(repo_name, commit)
+                    await self._process_github_commit(raw_buffer, repo_name, commit)
                     items_collected += 1
 
-                # Get recent issues
-                issues = await self.github_client.get_recent_issues(repo_name, days=7)
                 for issue in issues:
-                    await self._process_github_issue(repo_name, issue)
+                    await self._process_github_issue(raw_buffer, repo_name, issue)
                     items_collected += 1
 
-                # Get recent releases
-                releases = await self.github_client.get_recent_releases(
-                    repo_name, days=30
-                )
                 for release in releases:
-                    await self._process_github_release(repo_name, release)
+                    await self._process_github_release(raw_buffer, repo_name, release)
                     items_collected += 1
 
+            self._flush_raw_buffer(raw_buffer)
+
             job.status = JobStatus.COMPLETED
             job.completed_at = datetime.utcnow()
             job.items_collected = items_collected
 
         except Exception as e:
+            # Discard this collector's partial writes so the job row can commit
+            self.db.rollback()
             job.status = JobStatus.FAILED
             job.error = str(e)
             logger.error(f"GitHub collection failed: {e}")
 
+        self.db.add(job)
         self.db.commit()
         return job.items_collected
 
     async def _collect_rss(self) -> int:
         """Collect information from RSS feeds"""
         job = CollectionJob(
-            source="rss", type=CollectionType.RSS, status=JobStatus.RUNNING
+            source="rss",
+            type=CollectionType.RSS,
+            status=JobStatus.RUNNING,
+            started_at=datetime.utcnow(),
+            items_collected=0,
         )
-        self.db.add(job)
-        self.db.commit()
 
         try:
             items_collected = 0
-
-            for feed_url in self.sources["rss"]:
-                feed_data = await self.rss_parser.parse_feed(feed_url)
+            raw_buffer: Dict[type, List[Dict]] = defaultdict(list)
+
+            urls = self._unique_urls("rss")
+            cache = self._load_fetch_cache(urls)
+            session = await self._ensure_session()
+            feeds = await bounded_map(
+                lambda url: self.rss_parser.parse_feed(
+                    url,
+                    session=session,
+                    validators=self._cached_validators(cache, url),
+                ),
+                urls,
+                FETCH_CONCURRENCY,
+            )
+            for url, feed_data in zip(urls, feeds):
+                if not self._record_fetch(cache, url, feed_data.get("validators")):
+                    continue
                 for entry in feed_data.get("entries", []):
-                    await self._process_rss_entry(entry)
+                    await self._process_rss_entry(raw_buffer, entry)
                     items_collected += 1
 
+            self._flush_raw_buffer(raw_buffer)
+
             job.status = JobStatus.COMPLETED
             job.completed_at = datetime.utcnow()
             job.items_collected = items_collected
 
         except Exception as e:
+            # Discard this collector's partial writes so the job row can commit
+            self.db.rollback()
             job.status = JobStatus.FAILED
             job.error = str(e)
             logger.error(f"RSS collection failed: {e}")
 
+        self.db.add(job)
         self.db.commit()
         return job.items_collected
 
@@ -176,53 +250,205 @@ class CollectionAgent:
             source="web_scraping",
             type=CollectionType.WEB_SCRAPING,
             status=JobStatus.RUNNING,
+            started_at=datetime.utcnow(),
+            items_collected=0,
         )
-        self.db.add(job)
-        self.db.commit()
 
         try:
             items_collected = 0
-
-            for url in self.sources["web_scraping"]:
-                content = await self.web_scraper.scrape_url(url)
-                if content:
-                    await self._process_web_content(url, content)
+            raw_buffer: Dict[type, List[Dict]] = defaultdict(list)
+
+            urls = self._unique_urls("web_scraping")
+            cache = self._load_fetch_cache(urls)
+            session = await self._ensure_session()
+            pages = await bounded_map(
+                lambda url: self.web_scraper.scrape_url(
+                    url,
+                    session=session,
+                    validators=self._cached_validators(cache, url),
+                ),
+                urls,
+                FETCH_CONCURRENCY,
+            )
+            for url, content in zip(urls, pages):
+                # None means the page failed or is unchanged since the last run
+                if content and self._record_fetch(
+                    cache, url, content.get("validators")
+                ):
+                    await self._process_web_content(raw_buffer, url, content)
                     items_collected += 1
 
+            self._flush_raw_buffer(raw_buffer)
+
             job.status = JobStatus.COMPLETED
             job.completed_at = datetime.utcnow()
             job.items_collected = items_collected
 
         except Exception as e:
+            # Discard this collector's partial writes so the job row can commit
+            self.db.rollback()
             job.status = JobStatus.FAILED
             job.error = str(e)
             logger.error(f"Web scraping collection failed: {e}")
 
+        self.db.add(job)
         self.db.commit()
         return job.items_collected
 
-    async def _process_github_commit(self, repo_name: str, commit: Dict) -> None:
+    def _last_successful_start(self, source: str) -> Optional[datetime]:
+        """Return when the latest completed job for a source started"""
+        return (
+            self.db.query(func.max(CollectionJob.started_at))
+            .filter(
+                CollectionJob.source == source,
+                CollectionJob.status == JobStatus.COMPLETED,
+            )
+            .scalar()
+        )
+
+    def _unique_urls(self, source: str) -> List[str]:
+        """Deduplicate a source's URLs, skipping pages already fetched as feeds"""
+        seen = set(self.sources["rss"]) if source == "web_scraping" else set()
+        return [url for url in dict.fromkeys(self.sources[source]) if url not in seen]
+
+    def _load_fetch_cache(self, urls: List[str]) -> Dict[str, CollectionCache]:
+        """Load stored HTTP cache validators for the given URLs"""
+        rows = self.db.query(CollectionCache).filter(CollectionCache.url.in_(urls))
+        return {row.url: row for row in rows}
+
+    @staticmethod
+    def _cached_validators(
+        cache: Dict[str, CollectionCache], url: str
+    ) -> Optional[Dict]:
+        """Return the conditional GET validators stored for a URL"""
+        entry = cache.get(url)
+        if entry is None:
+            return None
+        return {"etag": entry.etag, "last_modified": entry.last_modified}
+
+    def _record_fetch(
+        self,
+        cache: Dict[str, CollectionCache],
+        url: str,
+        validators: Optional[Dict],
+    ) -> bool:
+        """Store fresh validators for a URL; return False if the body is unchanged"""
+        if not validators:
+            # Not modified (304) or fetch failed; nothing new to process
+            return False
+
+        entry = cache.get(url)
+        if entry is None:
+            entry = CollectionCache(url=url)
+            self.db.add(entry)
+            cache[url] = entry
+
+        changed = entry.content_hash != validators["content_hash"]
+        entry.etag = validators["etag"]
+        entry.last_modified = validators["last_modified"]
+        entry.content_hash = validators["content_hash"]
+        return changed
+
+    def _flush_raw_buffer(self, raw_buffer: Dict[type, List[Dict]]) -> None:
+        """Insert buffered raw items with one executemany per model"""
+        for model, rows in raw_buffer.items():
+            for start in range(0, len(rows), RAW_INSERT_CHUNK_SIZE):
+                self.db.execute(
+                    insert(model), rows[start : start + RAW_INSERT_CHUNK_SIZE]
+                )
+        raw_buffer.clear()
+
+    async def _process_github_commit(
+        self, raw_buffer: Dict[type, List[Dict]], repo_name: str, commit: Dict
+    ) -> None:
         """Process GitHub commit data"""
-        # Store commit information for analysis
-        # This would typically store in a raw data table
-        pass
+        message = commit.get("message") or ""
+        raw_buffer[SourceDataDB].append(
+            {
+                "source_type": "github_commit",
+                "source_url": commit.get("url"),
+                "title": message.split("\n", 1)[0][:500],
+                "content": message,
+                "source_metadata": {
+                    "repo": repo_name,
+                    "sha": commit.get("sha"),
+                    "author": commit.get("author"),
+                    "date": commit.get("date"),
+                },
+            }
+        )
 
-    async def _process_github_issue(self, repo_name: str, issue: Dict) -> None:
+    async def _process_github_issue(
+        self, raw_buffer: Dict[type, List[Dict]], repo_name: str, issue: Dict
+    ) -> None:
         """Process GitHub issue data"""
-        # Store issue information for analysis
-        pass
+        raw_buffer[SourceDataDB].append(
+            {
+                "source_type": "github_issue",
+                "source_url": issue.get("url"),
+                "title": (issue.get("title") or "")[:500],
+                "content": issue.get("body"),
+                "source_metadata": {
+                    "repo": repo_name,
+                    "number": issue.get("number"),
+                    "state": issue.get("state"),
+                    "labels": issue.get("labels", []),
+                    "created_at": issue.get("created_at"),
+                    "updated_at": issue.get("updated_at"),
+                },
+            }
+        )
 
-    async def _process_github_release(self, repo_name: str, release: Dict) -> None:
+    async def _process_github_release(
+        self, raw_buffer: Dict[type, List[Dict]], repo_name: str, release: Dict
+    ) -> None:
         """Process GitHub release data"""
-        # Store release information for analysis
-        pass
+        raw_buffer[SourceDataDB].append(
+            {
+                "source_type": "github_release",
+                "source_url": release.get("url"),
+                "title": (release.get("name") or release.get("tag_name") or "")[:500],
+                "content": release.get("body"),
+                "source_metadata": {
+                    "repo": repo_name,
+                    "tag_name": release.get("tag_name"),
+                    "published_at": release.get("published_at"),
+                    "assets": release.get("assets", []),
+                },
+            }
+        )
 
-    async def _process_rss_entry(self, entry: Dict) -> None:
+    async def _process_rss_entry(
+        self, raw_buffer: Dict[type, List[Dict]], entry: Dict
+    ) -> None:
         """Process RSS entry data"""
-        # Store RSS entry information for analysis
-        pass
+        raw_buffer[SourceDataDB].append(
+            {
+                "source_type": "rss",
+                "source_url": entry.get("link"),
+                "title": (entry.get("title") or "")[:500],
+                "content": entry.get("content") or entry.get("summary"),
+                "source_metadata": {
+                    "author": entry.get("author"),
+                    "published": entry.get("published"),
+                    "tags": entry.get("tags", []),
+                },
+            }
+        )
 
-    async def _process_web_content(self, url: str, content: str) -> None:
+    async def _process_web_content(
+        self, raw_buffer: Dict[type, List[Dict]], url: str, content: Dict
+    ) -> None:
         """Process web scraped content"""
-        # Store web content for analysis
-        pass
+        raw_buffer[SourceDataDB].append(
+            {
+                "source_type": "web_scraping",
+                "source_url": url,
+                "title": (content.get("title") or "")[:500],
+                "content": content.get("content"),
+                "source_metadata": {
+                    "description": content.get("description"),
+                    "word_count": content.get("word_count"),
+                },
+            }
+        )
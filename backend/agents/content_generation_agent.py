@@ -5,9 +5,11 @@ Generates blog posts, newsletters, and social media content
 
 import asyncio
 import logging
+import os
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.orm import Session
 
 from models.content import Article, Newsletter, Trend, TrendCategory, TrendImpact
@@ -16,9 +18,63 @@ from utils.ai_client import (
     ContentGenerationRequest,
     ContentGenerationResponse,
 )
+from utils.concurrency import bounded_map
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of AI generation requests in flight at once
+GENERATION_CONCURRENCY = int(os.getenv("AICA_GENERATION_CONCURRENCY", "8"))
+
+# Built once so every summary reuses the same compiled statement
+_SUMMARY_STMT = select(
+    select(func.count(Article.id)).scalar_subquery(),
+    select(func.count(Article.id))
+    .where(Article.created_at >= bindparam("since"))
+    .scalar_subquery(),
+    select(func.count(Newsletter.id)).scalar_subquery(),
+    select(func.count(Trend.id)).scalar_subquery(),
+)
+
+# Topics for blog posts based on trends
+_BLOG_TOPICS = (
+    "TypeScript 5.0 New Features and Migration Guide",
+    "Building Scalable React Apps with TypeScript",
+    "Next.js 14 App Router Best Practices",
+    "Vue 3 Composition API with TypeScript",
+    "Modern JavaScript Tooling: Vite, Bun, and Deno",
+)
+
+# Twitter/LinkedIn post topics
+_SOCIAL_TOPICS = (
+    "TypeScript tip of the week",
+    "New framework release",
+    "Developer tool recommendation",
+    "Code snippet showcase",
+)
+
+# Requests for the fixed topic sets are built once and reused on every run
+_BLOG_REQUESTS = tuple(
+    ContentGenerationRequest(
+        topic=topic,
+        content_type="blog_post",
+        target_audience="intermediate",
+        length="long",
+        style="technical",
+    )
+    for topic in _BLOG_TOPICS
+)
+
+_SOCIAL_REQUESTS = tuple(
+    ContentGenerationRequest(
+        topic=topic,
+        content_type="social_media",
+        target_audience="intermediate",
+        length="short",
+        style="casual",
+    )
+    for topic in _SOCIAL_TOPICS
+)
+
 
 class ContentGenerationAgent:
     """Agent responsible for generating content from analyzed data"""
@@ -53,23 +109,22 @@ class ContentGenerationAgent:
         """Generate blog posts from analyzed data"""
         logger.info("Generating blog posts...")
 
-        # Topics for blog posts based on trends
-        topics = [
-            "TypeScript 5.0 New Features and Migration Guide",
-            "Building Scalable React Apps with TypeScript",
-            "Next.js 14 App Router Best Practices",
-            "Vue 3 Composition API with TypeScript",
-            "Modern JavaScript Tooling: Vite, Bun, and Deno",
-        ]
+        outcomes = await bounded_map(
+            self._generate_blog_post,
+            _BLOG_REQUESTS,
+            GENERATION_CONCURRENCY,
+            return_exceptions=True,
+        )
 
         generated_count = 0
-        for topic in topics:
-            try:
-                article = await self._generate_blog_post(topic)
-                if article:
-                    generated_count += 1
-            except Exception as e:
-                logger.error(f"Failed to generate blog post for topic '{topic}': {e}")
+        for request, outcome in zip(_BLOG_REQUESTS, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(
+                    f"Failed to generate blog post for topic '{request.topic}': "
+                    f"{outcome}"
+                )
+            elif outcome:
+                generated_count += 1
 
         return generated_count
 
@@ -90,38 +145,30 @@ class ContentGenerationAgent:
         """Generate social media content"""
         logger.info("Generating social media content...")
 
-        # Generate Twitter/LinkedIn posts
-        social_topics = [
-            "TypeScript tip of the week",
-            "New framework release",
-            "Developer tool recommendation",
-            "Code snippet showcase",
-        ]
+        outcomes = await bounded_map(
+            self._generate_social_post,
+            _SOCIAL_REQUESTS,
+            GENERATION_CONCURRENCY,
+            return_exceptions=True,
+        )
 
         generated_count = 0
-        for topic in social_topics:
-            try:
-                content = await self._generate_social_post(topic)
-                if content:
-                    generated_count += 1
-            except Exception as e:
+        for request, outcome in zip(_SOCIAL_REQUESTS, outcomes):
+            if isinstance(outcome, Exception):
                 logger.error(
-                    f"Failed to generate social media content for '{topic}': {e}"
+                    "Failed to generate social media content for "
+                    f"'{request.topic}': {outcome}"
                 )
+            elif outcome:
+                generated_count += 1
 
         return generated_count
 
-    async def _generate_blog_post(self, topic: str) -> Optional[Article]:
+    async def _generate_blog_post(
+        self, request: ContentGenerationRequest
+    ) -> Optional[Article]:
         """Generate a single blog post"""
         try:
-            request = ContentGenerationRequest(
-                topic=topic,
-                content_type="blog_post",
-                target_audience="intermediate",
-                length="long",
-                style="technical",
-            )
-
             response = await self.ai_client.generate_content(request)
 
             # Create article record
@@ -177,17 +224,11 @@ class ContentGenerationAgent:
             logger.error(f"Failed to generate newsletter: {e}")
             return None
 
-    async def _generate_social_post(self, topic: str) -> Optional[Dict]:
+    async def _generate_social_post(
+        self, request: ContentGenerationRequest
+    ) -> Optional[Dict]:
         """Generate social media post"""
         try:
-            request = ContentGenerationRequest(
-                topic=topic,
-                content_type="social_media",
-                target_audience="intermediate",
-                length="short",
-                style="casual",
-            )
-
             response = await self.ai_client.generate_content(request)
 
             # For now, just log the social media content
@@ -242,22 +283,12 @@ class ContentGenerationAgent:
     async def get_content_summary(self) -> Dict:
         """Get summary of generated content"""
         try:
-            # Query content from database
-            total_articles = self.db.query(Article).count()
-            recent_articles = (
-                self.db.query(Article)
-                .filter(
-                    Article.created_at
-                    >= datetime.utcnow().replace(
-                        hour=0, minute=0, second=0, microsecond=0
-                    )
-                )
-                .count()
+            # Fetch all counts in one round-trip using scalar subqueries
+            today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+            total_articles, recent_articles, total_newsletters, total_trends = (
+                self.db.execute(_SUMMARY_STMT, {"since": today}).one()
             )
 
-            total_newsletters = self.db.query(Newsletter).count()
-            total_trends = self.db.query(Trend).count()
-
             return {
                 "total_articles": total_articles,
                 "recent_articles": recent_articles,
@@ -1,36 +1,18 @@
+import functools
+import logging
 import os
+import re
 import sys
 from logging.config import fileConfig
 from pathlib import Path
 
-# Load environment variables from .env.local
-from dotenv import load_dotenv
-
-# backend/.env.localを読み込む（backend/alembic/env.pyから見て../）
-env_path = Path(__file__).parent.parent / ".env.local"
-load_dotenv(env_path)
-
-from sqlalchemy import create_engine, engine_from_config, pool
+from sqlalchemy import create_engine, engine_from_config, make_url, pool
 
 from alembic import context
 
 # Add the backend directory to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from models.automated_content import (
-    AutomatedContentDB,
-    ContentGenerationLogDB,
-    SourceDataDB,
-    TrendDataDB,
-)
-
-# Import your models
-from models.base import Base
-from models.collection import AnalysisResult, CollectionJob
-from models.content import Article, Newsletter, Trend
-from models.subscription import Subscription
-from models.user import User
-
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -40,9 +22,67 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
-# add your model's MetaData object here
-# for 'autogenerate' support
-target_metadata = Base.metadata
+logger = logging.getLogger("alembic.env")
+
+# backend/.env.localを読み込む（backend/alembic/env.pyから見て../）
+ENV_PATH = Path(__file__).parent.parent / ".env.local"
+
+# Column type comparison only matters to 'autogenerate', which is a
+# development task; skip that reflection everywhere else
+AUTOGENERATE_COMPARE = os.getenv("ENVIRONMENT", "development") == "development"
+
+# Supabase pooler hint that psycopg2 rejects as a connection option
+_SUPABASE_POOLER_OPTION = re.compile(r"&supa=base-pooler\.x")
+
+
+@functools.lru_cache(maxsize=4)
+def _normalize_db_url(url: str) -> str:
+    """Rewrite DATABASE_URL into a form SQLAlchemy and psycopg2 accept"""
+    # Convert postgres:// to postgresql+psycopg2:// for SQLAlchemy
+    if url.startswith("postgres://"):
+        url = url.replace("postgres://", "postgresql+psycopg2://", 1)
+
+    # Remove invalid connection options
+    return _SUPABASE_POOLER_OPTION.sub("", url)
+
+
+def _setup() -> None:
+    """Load environment variables from .env.local before a migration run"""
+    from dotenv import load_dotenv
+
+    load_dotenv(ENV_PATH)
+
+
+@functools.lru_cache(maxsize=1)
+def _database_url() -> str:
+    """Read and normalize DATABASE_URL once per process, failing fast if unset"""
+    _setup()
+
+    # Use environment variable for database URL
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        raise ValueError("DATABASE_URL environment variable is required")
+
+    url = _normalize_db_url(url)
+    logger.info("Using database %s", make_url(url).render_as_string(hide_password=True))
+    return url
+
+
+def _load_metadata():
+    """Import the models and return the MetaData used for 'autogenerate'
+
+    Importing the models configures every mapper and pulls in the app's
+    dependencies, so it is deferred until a migration run actually needs it.
+    """
+    import models.automated_content  # noqa: F401
+    import models.collection  # noqa: F401
+    import models.content  # noqa: F401
+    import models.subscription  # noqa: F401
+    import models.user  # noqa: F401
+    from models.base import Base
+
+    return Base.metadata
+
 
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
@@ -62,24 +102,15 @@ def run_migrations_offline() -> None:
     script output.
 
     """
-    # Use environment variable for database URL
-    url = os.getenv("DATABASE_URL")
-    if not url:
-        raise ValueError("DATABASE_URL environment variable is required")
-
-    # Convert postgres:// to postgresql+psycopg2:// for SQLAlchemy
-    if url.startswith("postgres://"):
-        url = url.replace("postgres://", "postgresql+psycopg2://", 1)
-
-    # Remove invalid connection options
-    if "supa=base-pooler.x" in url:
-        url = url.replace("&supa=base-pooler.x", "")
+    url = _database_url()
 
+    # Offline mode only renders SQL, so the model metadata is never loaded
     context.configure(
         url=url,
-        target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        transaction_per_migration=True,
+        version_table_pk=True,
     )
 
     with context.begin_transaction():
@@ -93,26 +124,33 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
-    # Use environment variable for database URL
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        raise ValueError("DATABASE_URL environment variable is required")
-
-    # Convert postgres:// to postgresql+psycopg2:// for SQLAlchemy
-    if database_url.startswith("postgres://"):
-        database_url = database_url.replace("postgres://", "postgresql+psycopg2://", 1)
-
-    # Remove invalid connection options
-    if "supa=base-pooler.x" in database_url:
-        database_url = database_url.replace("&supa=base-pooler.x", "")
-
-    connectable = create_engine(
-        database_url,
-        poolclass=pool.NullPool,
-    )
+    database_url = _database_url()
+
+    # Pool settings are create_engine() arguments, not URL query parameters.
+    # ALEMBIC_POOL_MODE=null keeps the old NullPool behaviour for one-shot CI jobs
+    if os.getenv("ALEMBIC_POOL_MODE") == "null":
+        connectable = create_engine(database_url, poolclass=pool.NullPool)
+    else:
+        connectable = create_engine(
+            database_url,
+            pool_size=int(os.getenv("ALEMBIC_POOL_SIZE", "5")),
+            max_overflow=int(os.getenv("ALEMBIC_POOL_OVERFLOW", "10")),
+            pool_pre_ping=True,
+            pool_recycle=int(os.getenv("ALEMBIC_POOL_RECYCLE", "3600")),
+        )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        # Several revisions build indexes in autocommit blocks, which commit
+        # the open transaction; committing per revision keeps each revision's
+        # catalog locks short and its version stamp in step with its DDL
+        context.configure(
+            connection=connection,
+            target_metadata=_load_metadata(),
+            transaction_per_migration=True,
+            version_table_pk=True,
+            compare_type=AUTOGENERATE_COMPARE,
+            compare_server_default=False,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
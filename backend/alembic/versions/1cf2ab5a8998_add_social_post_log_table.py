@@ -18,12 +18,23 @@ down_revision: Union[str, Sequence[str], None] = "4741adeef488"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# (index name, indexed columns) on social_post_logs
+INDEXES = (
+    ("ix_social_post_logs_platform", ["platform"]),
+    ("ix_social_post_logs_post_type", ["post_type"]),
+    ("ix_social_post_logs_tweet_id", ["tweet_id"]),
+    ("ix_social_post_logs_status", ["status"]),
+    ("ix_social_post_logs_posted_at", ["posted_at"]),
+)
+
 
 def upgrade() -> None:
     """Upgrade schema."""
     op.create_table(
         "social_post_logs",
-        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "id", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), nullable=False
+        ),
         sa.Column(
             "platform", sa.String(length=50), nullable=False, server_default="twitter"
         ),
@@ -58,18 +69,27 @@ def upgrade() -> None:
         ),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index("ix_social_post_logs_platform", "social_post_logs", ["platform"])
-    op.create_index("ix_social_post_logs_post_type", "social_post_logs", ["post_type"])
-    op.create_index("ix_social_post_logs_tweet_id", "social_post_logs", ["tweet_id"])
-    op.create_index("ix_social_post_logs_status", "social_post_logs", ["status"])
-    op.create_index("ix_social_post_logs_posted_at", "social_post_logs", ["posted_at"])
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                "social_post_logs",
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
 
 
 def downgrade() -> None:
     """Downgrade schema."""
-    op.drop_index("ix_social_post_logs_posted_at", table_name="social_post_logs")
-    op.drop_index("ix_social_post_logs_status", table_name="social_post_logs")
-    op.drop_index("ix_social_post_logs_tweet_id", table_name="social_post_logs")
-    op.drop_index("ix_social_post_logs_post_type", table_name="social_post_logs")
-    op.drop_index("ix_social_post_logs_platform", table_name="social_post_logs")
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="social_post_logs",
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
     op.drop_table("social_post_logs")
@@ -171,7 +171,9 @@ def upgrade() -> None:
 
     op.create_table(
         "source_data",
-        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "id", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), nullable=False
+        ),
         sa.Column("source_type", sa.String(), nullable=True),
         sa.Column("source_url", sa.String(), nullable=True),
         sa.Column("title", sa.String(length=500), nullable=True),
@@ -193,7 +195,9 @@ def upgrade() -> None:
 
     op.create_table(
         "content_generation_logs",
-        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column(
+            "id", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), nullable=False
+        ),
         sa.Column("content_id", sa.Integer(), nullable=True),
         sa.Column("generation_type", sa.String(), nullable=True),
         sa.Column("status", sa.String(), nullable=True),
@@ -19,65 +19,61 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def _index_names(inspector, table: str) -> set[str]:
-    return {i["name"] for i in inspector.get_indexes(table)}
+# (table, new nullable column, column type, index on that column)
+COLUMNS = (
+    ("referral_links", "valid_until", sa.DateTime(), "ix_referral_links_valid_until"),
+    ("click_tracking", "session_id", sa.String(), "ix_click_tracking_session_id"),
+)
+
+
+def _column_names(bind, table: str) -> set[str]:
+    return {c["name"] for c in sa.inspect(bind).get_columns(table)}
 
 
 def upgrade() -> None:
     """Upgrade schema (idempotent for partially-applied DBs)."""
     bind = op.get_bind()
-    inspector = sa.inspect(bind)
-
-    ref_cols = {c["name"] for c in inspector.get_columns("referral_links")}
-    if "valid_until" not in ref_cols:
-        op.add_column(
-            "referral_links",
-            sa.Column("valid_until", sa.DateTime(), nullable=True),
-        )
-    inspector = sa.inspect(bind)
-    idx_ref = op.f("ix_referral_links_valid_until")
-    if idx_ref not in _index_names(inspector, "referral_links"):
-        op.create_index(
-            idx_ref,
-            "referral_links",
-            ["valid_until"],
-            unique=False,
-        )
-
-    click_cols = {c["name"] for c in inspector.get_columns("click_tracking")}
-    if "session_id" not in click_cols:
-        op.add_column(
-            "click_tracking",
-            sa.Column("session_id", sa.String(), nullable=True),
-        )
-    inspector = sa.inspect(bind)
-    idx_click = op.f("ix_click_tracking_session_id")
-    if idx_click not in _index_names(inspector, "click_tracking"):
-        op.create_index(
-            idx_click,
-            "click_tracking",
-            ["session_id"],
-            unique=False,
-        )
+
+    for table, column, column_type, _ in COLUMNS:
+        if bind.dialect.name == "postgresql":
+            # IF NOT EXISTS lets the server skip the reflection round-trip
+            type_sql = column_type.compile(dialect=bind.dialect)
+            op.execute(
+                sa.text(
+                    f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column} {type_sql}"
+                )
+            )
+        elif column not in _column_names(bind, table):
+            op.add_column(table, sa.Column(column, column_type, nullable=True))
+
+    # Both tables are live, so build the indexes without blocking writers
+    with op.get_context().autocommit_block():
+        for table, column, _, index in COLUMNS:
+            op.create_index(
+                op.f(index),
+                table,
+                [column],
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     bind = op.get_bind()
-    inspector = sa.inspect(bind)
-
-    idx_click = op.f("ix_click_tracking_session_id")
-    if idx_click in _index_names(inspector, "click_tracking"):
-        op.drop_index(idx_click, table_name="click_tracking")
-
-    idx_ref = op.f("ix_referral_links_valid_until")
-    if idx_ref in _index_names(inspector, "referral_links"):
-        op.drop_index(idx_ref, table_name="referral_links")
-
-    click_cols = {c["name"] for c in inspector.get_columns("click_tracking")}
-    if "session_id" in click_cols:
-        op.drop_column("click_tracking", "session_id")
 
-    ref_cols = {c["name"] for c in inspector.get_columns("referral_links")}
-    if "valid_until" in ref_cols:
-        op.drop_column("referral_links", "valid_until")
+    with op.get_context().autocommit_block():
+        for table, _, _, index in reversed(COLUMNS):
+            op.drop_index(
+                op.f(index),
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
+
+    for table, column, _, _ in reversed(COLUMNS):
+        if bind.dialect.name == "postgresql":
+            op.execute(sa.text(f"ALTER TABLE {table} DROP COLUMN IF EXISTS {column}"))
+        elif column in _column_names(bind, table):
+            op.drop_column(table, column)
@@ -19,36 +19,54 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
-def upgrade() -> None:
-    """Upgrade schema."""
-    # Check if metadata column exists before renaming
-    # This handles the case where the table was created with the old column name
+# Renames the column only when the source name exists and the target does not,
+# evaluated server-side in a single round-trip
+_RENAME_IF_PRESENT = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'social_post_logs' AND column_name = '{old}'
+    ) AND NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'social_post_logs' AND column_name = '{new}'
+    ) THEN
+        EXECUTE 'ALTER TABLE social_post_logs RENAME COLUMN {old} TO {new}';
+    END IF;
+END $$;
+"""
+
+
+def _rename_column(old: str, new: str) -> None:
     conn = op.get_bind()
+    if conn.dialect.name == "postgresql":
+        op.execute(sa.text(_RENAME_IF_PRESENT.format(old=old, new=new)))
+        return
+
+    # Other dialects have no DO blocks, so check via reflection
     inspector = sa.inspect(conn)
     columns = [col["name"] for col in inspector.get_columns("social_post_logs")]
 
-    if "metadata" in columns and "post_metadata" not in columns:
+    if old in columns and new not in columns:
         op.alter_column(
             "social_post_logs",
-            "metadata",
-            new_column_name="post_metadata",
+            old,
+            new_column_name=new,
             existing_type=sa.JSON(),
             existing_nullable=True,
         )
 
 
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Check if metadata column exists before renaming
+    # This handles the case where the table was created with the old column name
+    _rename_column("metadata", "post_metadata")
+
+
 def downgrade() -> None:
     """Downgrade schema."""
     # Rename back to metadata for rollback
-    conn = op.get_bind()
-    inspector = sa.inspect(conn)
-    columns = [col["name"] for col in inspector.get_columns("social_post_logs")]
-
-    if "post_metadata" in columns and "metadata" not in columns:
-        op.alter_column(
-            "social_post_logs",
-            "post_metadata",
-            new_column_name="metadata",
-            existing_type=sa.JSON(),
-            existing_nullable=True,
-        )
+    _rename_column("post_metadata", "metadata")
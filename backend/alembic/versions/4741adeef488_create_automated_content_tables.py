@@ -18,114 +18,189 @@ down_revision: Union[str, Sequence[str], None] = "223a0ac841bb"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# (index name, table, indexed columns, unique) created after the tables
+INDEXES = (
+    (
+        "ix_automated_contents_content_type",
+        "automated_contents",
+        ["content_type"],
+        False,
+    ),
+    ("ix_automated_contents_created_at", "automated_contents", ["created_at"], False),
+    ("ix_automated_contents_id", "automated_contents", ["id"], False),
+    ("ix_automated_contents_slug", "automated_contents", ["slug"], True),
+    ("ix_trend_data_detected_at", "trend_data", ["detected_at"], False),
+    ("ix_trend_data_id", "trend_data", ["id"], False),
+    ("ix_trend_data_trend_name", "trend_data", ["trend_name"], False),
+    ("ix_source_data_collected_at", "source_data", ["collected_at"], False),
+    ("ix_source_data_id", "source_data", ["id"], False),
+    ("ix_source_data_source_type", "source_data", ["source_type"], False),
+    (
+        "ix_content_generation_logs_created_at",
+        "content_generation_logs",
+        ["created_at"],
+        False,
+    ),
+    ("ix_content_generation_logs_id", "content_generation_logs", ["id"], False),
+)
+
+
+def _index_ddl(name: str, table: str, columns: list, unique: bool) -> str:
+    unique_sql = "UNIQUE " if unique else ""
+    return (
+        f"CREATE {unique_sql}INDEX IF NOT EXISTS {name} "
+        f"ON {table} ({', '.join(columns)})"
+    )
+
 
 def upgrade() -> None:
     """Upgrade schema."""
+    # The initial migration (223a0ac841bb) already creates these tables, so
+    # only create whatever is missing
+    bind = op.get_bind()
+    if op.get_context().as_sql:
+        # Offline scripts cannot reflect; the initial migration precedes this one
+        existing_tables = {table for _, table, _, _ in INDEXES}
+    else:
+        existing_tables = set(sa.inspect(bind).get_table_names())
+
     # Create automated_contents table
-    op.create_table(
-        "automated_contents",
-        sa.Column("id", sa.Integer(), nullable=False),
-        sa.Column("content_type", sa.String(), nullable=True),
-        sa.Column("title", sa.String(length=300), nullable=True),
-        sa.Column("slug", sa.String(length=300), nullable=True),
-        sa.Column("summary", sa.Text(), nullable=True),
-        sa.Column("content", sa.Text(), nullable=True),
-        sa.Column("content_metadata", sa.JSON(), nullable=True),
-        sa.Column("seo_data", sa.JSON(), nullable=True),
-        sa.Column("quality_score", sa.Float(), nullable=True),
-        sa.Column("status", sa.String(), nullable=True),
-        sa.Column("published_at", sa.DateTime(), nullable=True),
-        sa.Column("created_at", sa.DateTime(), nullable=True),
-        sa.Column("updated_at", sa.DateTime(), nullable=True),
-        sa.PrimaryKeyConstraint("id"),
-    )
-    op.create_index(
-        "ix_automated_contents_content_type", "automated_contents", ["content_type"]
-    )
-    op.create_index(
-        "ix_automated_contents_created_at", "automated_contents", ["created_at"]
-    )
-    op.create_index("ix_automated_contents_id", "automated_contents", ["id"])
-    op.create_index(
-        "ix_automated_contents_slug", "automated_contents", ["slug"], unique=True
-    )
+    if "automated_contents" not in existing_tables:
+        op.create_table(
+            "automated_contents",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("content_type", sa.String(length=32), nullable=True),
+            sa.Column("title", sa.String(length=300), nullable=True),
+            sa.Column("slug", sa.String(length=300), nullable=True),
+            sa.Column("summary", sa.Text(), nullable=True),
+            sa.Column("content", sa.Text(), nullable=True),
+            sa.Column("content_metadata", sa.JSON(), nullable=True),
+            sa.Column("seo_data", sa.JSON(), nullable=True),
+            sa.Column("quality_score", sa.Float(), nullable=True),
+            sa.Column("status", sa.String(length=32), nullable=True),
+            sa.Column("published_at", sa.DateTime(), nullable=True),
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                nullable=True,
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+            ),
+            sa.Column(
+                "updated_at",
+                sa.DateTime(),
+                nullable=True,
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+            ),
+            sa.PrimaryKeyConstraint("id"),
+        )
 
     # Create trend_data table
-    op.create_table(
-        "trend_data",
-        sa.Column("id", sa.Integer(), nullable=False),
-        sa.Column("trend_name", sa.String(length=200), nullable=True),
-        sa.Column("trend_score", sa.Float(), nullable=True),
-        sa.Column("source_count", sa.Integer(), nullable=True),
-        sa.Column("keywords", sa.JSON(), nullable=True),
-        sa.Column("related_topics", sa.JSON(), nullable=True),
-        sa.Column("data_snapshot", sa.JSON(), nullable=True),
-        sa.Column("detected_at", sa.DateTime(), nullable=True),
-        sa.PrimaryKeyConstraint("id"),
-    )
-    op.create_index("ix_trend_data_detected_at", "trend_data", ["detected_at"])
-    op.create_index("ix_trend_data_id", "trend_data", ["id"])
-    op.create_index("ix_trend_data_trend_name", "trend_data", ["trend_name"])
+    if "trend_data" not in existing_tables:
+        op.create_table(
+            "trend_data",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("trend_name", sa.String(length=200), nullable=True),
+            sa.Column("trend_score", sa.Float(), nullable=True),
+            sa.Column("source_count", sa.Integer(), nullable=True),
+            sa.Column("keywords", sa.JSON(), nullable=True),
+            sa.Column("related_topics", sa.JSON(), nullable=True),
+            sa.Column("data_snapshot", sa.JSON(), nullable=True),
+            sa.Column(
+                "detected_at",
+                sa.DateTime(),
+                nullable=True,
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+            ),
+            sa.PrimaryKeyConstraint("id"),
+        )
 
     # Create source_data table
-    op.create_table(
-        "source_data",
-        sa.Column("id", sa.Integer(), nullable=False),
-        sa.Column("source_type", sa.String(), nullable=True),
-        sa.Column("source_url", sa.String(), nullable=True),
-        sa.Column("title", sa.String(length=500), nullable=True),
-        sa.Column("content", sa.Text(), nullable=True),
-        sa.Column("score", sa.Float(), nullable=True),
-        sa.Column("source_metadata", sa.JSON(), nullable=True),
-        sa.Column("collected_at", sa.DateTime(), nullable=True),
-        sa.PrimaryKeyConstraint("id"),
-    )
-    op.create_index("ix_source_data_collected_at", "source_data", ["collected_at"])
-    op.create_index("ix_source_data_id", "source_data", ["id"])
-    op.create_index("ix_source_data_source_type", "source_data", ["source_type"])
+    if "source_data" not in existing_tables:
+        op.create_table(
+            "source_data",
+            sa.Column(
+                "id",
+                sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+                nullable=False,
+            ),
+            sa.Column("source_type", sa.String(length=32), nullable=True),
+            sa.Column("source_url", sa.String(length=2048), nullable=True),
+            sa.Column("title", sa.String(length=500), nullable=True),
+            sa.Column("content", sa.Text(), nullable=True),
+            sa.Column("score", sa.Float(), nullable=True),
+            sa.Column("source_metadata", sa.JSON(), nullable=True),
+            sa.Column(
+                "collected_at",
+                sa.DateTime(),
+                nullable=True,
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+            ),
+            sa.PrimaryKeyConstraint("id"),
+        )
 
     # Create content_generation_logs table
-    op.create_table(
-        "content_generation_logs",
-        sa.Column("id", sa.Integer(), nullable=False),
-        sa.Column("content_id", sa.Integer(), nullable=True),
-        sa.Column("generation_type", sa.String(), nullable=True),
-        sa.Column("status", sa.String(), nullable=True),
-        sa.Column("error_message", sa.Text(), nullable=True),
-        sa.Column("api_cost", sa.Float(), nullable=True),
-        sa.Column("generation_time", sa.Float(), nullable=True),
-        sa.Column("quality_score", sa.Float(), nullable=True),
-        sa.Column("created_at", sa.DateTime(), nullable=True),
-        sa.PrimaryKeyConstraint("id"),
-    )
-    op.create_index(
-        "ix_content_generation_logs_created_at",
-        "content_generation_logs",
-        ["created_at"],
-    )
-    op.create_index("ix_content_generation_logs_id", "content_generation_logs", ["id"])
+    if "content_generation_logs" not in existing_tables:
+        op.create_table(
+            "content_generation_logs",
+            sa.Column(
+                "id",
+                sa.BigInteger().with_variant(sa.Integer(), "sqlite"),
+                nullable=False,
+            ),
+            sa.Column("content_id", sa.Integer(), nullable=True),
+            sa.Column("generation_type", sa.String(length=32), nullable=True),
+            sa.Column("status", sa.String(length=32), nullable=True),
+            sa.Column("error_message", sa.Text(), nullable=True),
+            sa.Column("api_cost", sa.Float(), nullable=True),
+            sa.Column("generation_time", sa.Float(), nullable=True),
+            sa.Column("quality_score", sa.Float(), nullable=True),
+            sa.Column(
+                "created_at",
+                sa.DateTime(),
+                nullable=True,
+                server_default=sa.text("CURRENT_TIMESTAMP"),
+            ),
+            sa.PrimaryKeyConstraint("id"),
+        )
+
+    new_indexes = [ix for ix in INDEXES if ix[1] not in existing_tables]
+    old_indexes = [ix for ix in INDEXES if ix[1] in existing_tables]
+
+    # Tables created above are still empty and invisible to other sessions,
+    # so their indexes are built in the same transaction. On PostgreSQL they
+    # go out as one multi-statement string, i.e. a single round-trip
+    if bind.dialect.name == "postgresql":
+        if new_indexes:
+            op.execute(sa.text(";\n".join(_index_ddl(*ix) for ix in new_indexes)))
+    else:
+        for name, table, columns, unique in new_indexes:
+            op.create_index(name, table, columns, unique=unique, if_not_exists=True)
+
+    # Tables that already hold data get their indexes built concurrently, which
+    # cannot run inside a transaction block (or a multi-statement string)
+    if old_indexes:
+        with op.get_context().autocommit_block():
+            for name, table, columns, unique in old_indexes:
+                op.create_index(
+                    name,
+                    table,
+                    columns,
+                    unique=unique,
+                    if_not_exists=True,
+                    postgresql_concurrently=True,
+                )
 
 
 def downgrade() -> None:
     """Downgrade schema."""
-    op.drop_index("ix_content_generation_logs_id", table_name="content_generation_logs")
-    op.drop_index(
-        "ix_content_generation_logs_created_at", table_name="content_generation_logs"
-    )
-    op.drop_table("content_generation_logs")
-
-    op.drop_index("ix_source_data_source_type", table_name="source_data")
-    op.drop_index("ix_source_data_id", table_name="source_data")
-    op.drop_index("ix_source_data_collected_at", table_name="source_data")
-    op.drop_table("source_data")
-
-    op.drop_index("ix_trend_data_trend_name", table_name="trend_data")
-    op.drop_index("ix_trend_data_id", table_name="trend_data")
-    op.drop_index("ix_trend_data_detected_at", table_name="trend_data")
-    op.drop_table("trend_data")
-
-    op.drop_index("ix_automated_contents_slug", table_name="automated_contents")
-    op.drop_index("ix_automated_contents_id", table_name="automated_contents")
-    op.drop_index("ix_automated_contents_created_at", table_name="automated_contents")
-    op.drop_index("ix_automated_contents_content_type", table_name="automated_contents")
-    op.drop_table("automated_contents")
+    # The tables and their other indexes belong to the initial migration and
+    # are dropped by its downgrade; only the id indexes are unique to this one
+    with op.get_context().autocommit_block():
+        for name, table, columns, _ in reversed(INDEXES):
+            if columns == ["id"]:
+                op.drop_index(
+                    name,
+                    table_name=table,
+                    if_exists=True,
+                    postgresql_concurrently=True,
+                )
@@ -18,136 +18,125 @@ down_revision: Union[str, Sequence[str], None] = "4741adeef488"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
-
-def _has_table(inspector, table_name: str) -> bool:
-    return table_name in inspector.get_table_names()
+# Standalone table definitions, so each CREATE/DROP carries its own
+# IF [NOT] EXISTS guard and no reflection is needed
+_metadata = sa.MetaData()
+
+_CURRENT_TIMESTAMP = sa.text("CURRENT_TIMESTAMP")
+
+
+def _timestamp_column(name: str) -> sa.Column:
+    """NOT NULL timestamp defaulting to the server's current time"""
+    return sa.Column(
+        name, sa.DateTime(), nullable=False, server_default=_CURRENT_TIMESTAMP
+    )
+
+
+_ANALYTICS_EVENTS = sa.Table(
+    "analytics_events",
+    _metadata,
+    sa.Column("id", sa.Integer(), primary_key=True),
+    sa.Column("event_type", sa.String()),
+    sa.Column("user_id", sa.String(), nullable=True),
+    sa.Column("session_id", sa.String(), nullable=True),
+    sa.Column("properties", sa.JSON(), nullable=True),
+    _timestamp_column("created_at"),
+)
+
+_METRIC_SNAPSHOTS = sa.Table(
+    "metric_snapshots",
+    _metadata,
+    sa.Column("id", sa.Integer(), primary_key=True),
+    sa.Column("metric_name", sa.String()),
+    sa.Column("metric_value", sa.Float(), nullable=False),
+    sa.Column("dimensions", sa.JSON(), nullable=True),
+    _timestamp_column("timestamp"),
+)
+
+_REPORTS = sa.Table(
+    "reports",
+    _metadata,
+    sa.Column("id", sa.Integer(), primary_key=True),
+    sa.Column("report_type", sa.String(), nullable=False),
+    sa.Column("title", sa.String(length=200), nullable=False),
+    sa.Column("description", sa.Text(), nullable=True),
+    sa.Column("parameters", sa.JSON(), nullable=True),
+    sa.Column("data", sa.JSON(), nullable=True),
+    sa.Column("format", sa.String(), nullable=False, server_default="json"),
+    sa.Column("file_url", sa.String(), nullable=True),
+    sa.Column("created_by", sa.String(), nullable=True),
+    _timestamp_column("created_at"),
+)
+
+_SCHEDULED_REPORTS = sa.Table(
+    "scheduled_reports",
+    _metadata,
+    sa.Column("id", sa.Integer(), primary_key=True),
+    sa.Column("report_type", sa.String(), nullable=False),
+    sa.Column("title", sa.String(length=200), nullable=False),
+    sa.Column("frequency", sa.String(), nullable=False),
+    sa.Column("recipients", sa.JSON(), nullable=True),
+    sa.Column("parameters", sa.JSON(), nullable=True),
+    sa.Column("next_run", sa.DateTime(), nullable=False),
+    _timestamp_column("created_at"),
+)
+
+_DASHBOARDS = sa.Table(
+    "dashboards",
+    _metadata,
+    sa.Column("id", sa.Integer(), primary_key=True),
+    sa.Column("name", sa.String(length=200), nullable=False),
+    sa.Column("layout", sa.JSON(), nullable=True),
+    sa.Column("filters", sa.JSON(), nullable=True),
+    sa.Column("created_by", sa.String(), nullable=True),
+    _timestamp_column("created_at"),
+    _timestamp_column("updated_at"),
+)
+
+_USER_SEGMENTS = sa.Table(
+    "user_segments",
+    _metadata,
+    sa.Column("id", sa.Integer(), primary_key=True),
+    sa.Column("name", sa.String(length=200), nullable=False),
+    sa.Column("conditions", sa.JSON(), nullable=True),
+    sa.Column("description", sa.Text(), nullable=True),
+    sa.Column("created_by", sa.String(), nullable=True),
+    _timestamp_column("created_at"),
+)
+
+# Creation order; downgrade drops in reverse
+TABLES = (
+    _ANALYTICS_EVENTS,
+    _METRIC_SNAPSHOTS,
+    _REPORTS,
+    _SCHEDULED_REPORTS,
+    _DASHBOARDS,
+    _USER_SEGMENTS,
+)
+
+# (index name, table, indexed columns) built once every table exists
+INDEXES = (
+    ("ix_analytics_events_event_type", "analytics_events", ["event_type"]),
+    ("ix_analytics_events_user_id", "analytics_events", ["user_id"]),
+    ("ix_analytics_events_session_id", "analytics_events", ["session_id"]),
+    ("ix_metric_snapshots_metric_name", "metric_snapshots", ["metric_name"]),
+)
 
 
 def upgrade() -> None:
     """Upgrade schema."""
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
-
-    if not _has_table(inspector, "analytics_events"):
-        op.create_table(
-            "analytics_events",
-            sa.Column("id", sa.Integer(), primary_key=True),
-            sa.Column("event_type", sa.String(), index=True),
-            sa.Column("user_id", sa.String(), index=True, nullable=True),
-            sa.Column("session_id", sa.String(), index=True, nullable=True),
-            sa.Column("properties", sa.JSON(), nullable=True),
-            sa.Column(
-                "created_at",
-                sa.DateTime(),
-                nullable=False,
-                server_default=sa.text("CURRENT_TIMESTAMP"),
-            ),
-        )
-
-    if not _has_table(inspector, "metric_snapshots"):
-        op.create_table(
-            "metric_snapshots",
-            sa.Column("id", sa.Integer(), primary_key=True),
-            sa.Column("metric_name", sa.String(), index=True),
-            sa.Column("metric_value", sa.Float(), nullable=False),
-            sa.Column("dimensions", sa.JSON(), nullable=True),
-            sa.Column(
-                "timestamp",
-                sa.DateTime(),
-                nullable=False,
-                server_default=sa.text("CURRENT_TIMESTAMP"),
-            ),
-        )
-
-    if not _has_table(inspector, "reports"):
-        op.create_table(
-            "reports",
-            sa.Column("id", sa.Integer(), primary_key=True),
-            sa.Column("report_type", sa.String(), nullable=False),
-            sa.Column("title", sa.String(length=200), nullable=False),
-            sa.Column("description", sa.Text(), nullable=True),
-            sa.Column("parameters", sa.JSON(), nullable=True),
-            sa.Column("data", sa.JSON(), nullable=True),
-            sa.Column("format", sa.String(), nullable=False, server_default="json"),
-            sa.Column("file_url", sa.String(), nullable=True),
-            sa.Column("created_by", sa.String(), nullable=True),
-            sa.Column(
-                "created_at",
-                sa.DateTime(),
-                nullable=False,
-                server_default=sa.text("CURRENT_TIMESTAMP"),
-            ),
-        )
-
-    if not _has_table(inspector, "scheduled_reports"):
-        op.create_table(
-            "scheduled_reports",
-            sa.Column("id", sa.Integer(), primary_key=True),
-            sa.Column("report_type", sa.String(), nullable=False),
-            sa.Column("title", sa.String(length=200), nullable=False),
-            sa.Column("frequency", sa.String(), nullable=False),
-            sa.Column("recipients", sa.JSON(), nullable=True),
-            sa.Column("parameters", sa.JSON(), nullable=True),
-            sa.Column("next_run", sa.DateTime(), nullable=False),
-            sa.Column(
-                "created_at",
-                sa.DateTime(),
-                nullable=False,
-                server_default=sa.text("CURRENT_TIMESTAMP"),
-            ),
-        )
-
-    if not _has_table(inspector, "dashboards"):
-        op.create_table(
-            "dashboards",
-            sa.Column("id", sa.Integer(), primary_key=True),
-            sa.Column("name", sa.String(length=200), nullable=False),
-            sa.Column("layout", sa.JSON(), nullable=True),
-            sa.Column("filters", sa.JSON(), nullable=True),
-            sa.Column("created_by", sa.String(), nullable=True),
-            sa.Column(
-                "created_at",
-                sa.DateTime(),
-                nullable=False,
-                server_default=sa.text("CURRENT_TIMESTAMP"),
-            ),
-            sa.Column(
-                "updated_at",
-                sa.DateTime(),
-                nullable=False,
-                server_default=sa.text("CURRENT_TIMESTAMP"),
-            ),
-        )
-
-    if not _has_table(inspector, "user_segments"):
-        op.create_table(
-            "user_segments",
-            sa.Column("id", sa.Integer(), primary_key=True),
-            sa.Column("name", sa.String(length=200), nullable=False),
-            sa.Column("conditions", sa.JSON(), nullable=True),
-            sa.Column("description", sa.Text(), nullable=True),
-            sa.Column("created_by", sa.String(), nullable=True),
-            sa.Column(
-                "created_at",
-                sa.DateTime(),
-                nullable=False,
-                server_default=sa.text("CURRENT_TIMESTAMP"),
-            ),
-        )
+    # The server checks for existing tables; earlier deployments may have
+    # created some of them through create_all()
+    for table in TABLES:
+        op.execute(sa.schema.CreateTable(table, if_not_exists=True))
+
+    # Secondary indexes go in a second pass, after the heaps; the whole
+    # upgrade runs in the migration's single DDL transaction
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
 
 
 def downgrade() -> None:
     """Downgrade schema."""
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
-
-    for table in [
-        "user_segments",
-        "dashboards",
-        "scheduled_reports",
-        "reports",
-        "metric_snapshots",
-        "analytics_events",
-    ]:
-        if _has_table(inspector, table):
-            op.drop_table(table)
+    for table in reversed(TABLES):
+        op.execute(sa.schema.DropTable(table, if_exists=True))
@@ -0,0 +1,67 @@
+"""convert json columns to jsonb
+
+Revision ID: a9c4e7f2b1d3
+Revises: f3b8d5a1c7e9
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a9c4e7f2b1d3"
+down_revision: Union[str, Sequence[str], None] = "f3b8d5a1c7e9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, JSON columns) stored as JSONB on PostgreSQL
+JSON_COLUMNS = (
+    ("social_post_logs", ["hashtags", "tweet_metrics", "post_metadata"]),
+    ("automated_contents", ["content_metadata", "seo_data"]),
+    ("trend_data", ["keywords", "related_topics", "data_snapshot"]),
+    ("source_data", ["source_metadata"]),
+)
+
+KEYWORDS_GIN_INDEX = "ix_trend_data_keywords_gin"
+
+
+def _convert(json_type: str) -> None:
+    # One ALTER TABLE per table so each table is rewritten only once
+    for table, columns in JSON_COLUMNS:
+        clauses = ", ".join(
+            f"ALTER COLUMN {column} TYPE {json_type} USING {column}::{json_type}"
+            for column in columns
+        )
+        op.execute(sa.text(f"ALTER TABLE {table} {clauses}"))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Other dialects have no binary JSON type; SQLite keeps JSON text
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _convert("jsonb")
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            sa.text(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {KEYWORDS_GIN_INDEX} "
+                "ON trend_data USING GIN (keywords jsonb_path_ops)"
+            )
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(sa.text(f"DROP INDEX CONCURRENTLY IF EXISTS {KEYWORDS_GIN_INDEX}"))
+
+    _convert("json")
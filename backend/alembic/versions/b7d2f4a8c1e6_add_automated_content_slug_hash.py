@@ -0,0 +1,80 @@
+"""add automated content slug hash
+
+Revision ID: b7d2f4a8c1e6
+Revises: a9c4e7f2b1d3
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d2f4a8c1e6"
+down_revision: Union[str, Sequence[str], None] = "a9c4e7f2b1d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Generated columns and hashtextextended() are PostgreSQL-only; other
+    # dialects keep the unique index on slug itself
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        sa.text(
+            "ALTER TABLE automated_contents ADD COLUMN IF NOT EXISTS slug_hash BIGINT "
+            "GENERATED ALWAYS AS (hashtextextended(slug, 0)) STORED"
+        )
+    )
+
+    # Uniqueness is enforced on the fixed-width hash; slug keeps a smaller
+    # non-unique pattern index for lookups and prefix search
+    with op.get_context().autocommit_block():
+        op.execute(
+            sa.text(
+                "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "
+                "ix_automated_contents_slug_hash ON automated_contents (slug_hash)"
+            )
+        )
+        op.execute(
+            sa.text(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                "ix_automated_contents_slug_pattern "
+                "ON automated_contents (slug text_pattern_ops)"
+            )
+        )
+        op.execute(
+            sa.text("DROP INDEX CONCURRENTLY IF EXISTS ix_automated_contents_slug")
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            sa.text(
+                "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "
+                "ix_automated_contents_slug ON automated_contents (slug)"
+            )
+        )
+        op.execute(
+            sa.text(
+                "DROP INDEX CONCURRENTLY IF EXISTS ix_automated_contents_slug_pattern"
+            )
+        )
+        op.execute(
+            sa.text("DROP INDEX CONCURRENTLY IF EXISTS ix_automated_contents_slug_hash")
+        )
+
+    op.execute(
+        sa.text("ALTER TABLE automated_contents DROP COLUMN IF EXISTS slug_hash")
+    )
@@ -0,0 +1,50 @@
+"""use timestamptz for metrics_updated_at
+
+Revision ID: c3e9a5b2d8f1
+Revises: b7d2f4a8c1e6
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e9a5b2d8f1"
+down_revision: Union[str, Sequence[str], None] = "b7d2f4a8c1e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite has no zone-aware timestamp type
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    # posted_at and created_at are already TIMESTAMPTZ; stored naive values
+    # were written as UTC
+    op.alter_column(
+        "social_post_logs",
+        "metrics_updated_at",
+        type_=sa.DateTime(timezone=True),
+        existing_type=sa.DateTime(),
+        existing_nullable=True,
+        postgresql_using="metrics_updated_at AT TIME ZONE 'UTC'",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.alter_column(
+        "social_post_logs",
+        "metrics_updated_at",
+        type_=sa.DateTime(),
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=True,
+        postgresql_using="metrics_updated_at AT TIME ZONE 'UTC'",
+    )
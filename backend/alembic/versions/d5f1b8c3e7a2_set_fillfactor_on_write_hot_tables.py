@@ -0,0 +1,43 @@
+"""set fillfactor on write-hot tables
+
+Revision ID: d5f1b8c3e7a2
+Revises: c3e9a5b2d8f1
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5f1b8c3e7a2"
+down_revision: Union[str, Sequence[str], None] = "c3e9a5b2d8f1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows here are rewritten in place (metrics refresh, updated_at trigger);
+# free space on each page lets PostgreSQL keep those updates HOT
+TABLES = ("social_post_logs", "automated_contents")
+FILLFACTOR = 70
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    # Applies to newly written pages; existing pages fill up as rows churn
+    for table in TABLES:
+        op.execute(sa.text(f"ALTER TABLE {table} SET (fillfactor = {FILLFACTOR})"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for table in TABLES:
+        op.execute(sa.text(f"ALTER TABLE {table} RESET (fillfactor)"))
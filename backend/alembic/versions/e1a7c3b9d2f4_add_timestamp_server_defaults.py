@@ -0,0 +1,77 @@
+"""add timestamp server defaults
+
+Revision ID: e1a7c3b9d2f4
+Revises: d4e8a1f2b3c5
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1a7c3b9d2f4"
+down_revision: Union[str, Sequence[str], None] = "d4e8a1f2b3c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, timestamp columns) that get a CURRENT_TIMESTAMP server default
+TIMESTAMP_COLUMNS = (
+    ("automated_contents", ["created_at", "updated_at"]),
+    ("trend_data", ["detected_at"]),
+    ("source_data", ["collected_at"]),
+    ("content_generation_logs", ["created_at"]),
+)
+
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    server_default=sa.text("CURRENT_TIMESTAMP"),
+                )
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(sa.text(SET_UPDATED_AT_FUNCTION))
+        op.execute(
+            sa.text(
+                "CREATE TRIGGER trg_automated_contents_updated_at "
+                "BEFORE UPDATE ON automated_contents "
+                "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+            )
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            sa.text(
+                "DROP TRIGGER IF EXISTS trg_automated_contents_updated_at "
+                "ON automated_contents"
+            )
+        )
+        op.execute(sa.text("DROP FUNCTION IF EXISTS set_updated_at()"))
+
+    for table, columns in reversed(TIMESTAMP_COLUMNS):
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column, existing_type=sa.DateTime(), server_default=None
+                )
@@ -0,0 +1,94 @@
+"""add partial affiliate indexes
+
+Revision ID: e8a2c6f4b9d1
+Revises: d5f1b8c3e7a2
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8a2c6f4b9d1"
+down_revision: Union[str, Sequence[str], None] = "d5f1b8c3e7a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, indexed columns, access method, predicate) matching the
+# filters in AffiliateService; only the rows those queries read are indexed
+INDEXES = (
+    (
+        "ix_referral_links_active_affiliate",
+        "referral_links",
+        ["affiliate_id", "valid_until"],
+        "btree",
+        "is_active",
+    ),
+    (
+        "ix_conversions_pending_affiliate",
+        "conversions",
+        ["affiliate_id"],
+        "btree",
+        "status = 'pending'",
+    ),
+    (
+        "ix_payouts_pending_requested_at",
+        "payouts",
+        ["requested_at"],
+        "btree",
+        "status = 'pending'",
+    ),
+    # Append-only click log: a BRIN summary per block range is a fraction of
+    # a B-tree's size for time-range scans
+    (
+        "ix_click_tracking_clicked_at_brin",
+        "click_tracking",
+        ["clicked_at"],
+        "brin",
+        None,
+    ),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Partial and BRIN indexes are PostgreSQL-only
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # The affiliate tables are created by the application, not by this chain
+    if op.get_context().as_sql:
+        existing_tables = {table for _, table, _, _, _ in INDEXES}
+    else:
+        existing_tables = set(sa.inspect(bind).get_table_names())
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, using, where in INDEXES:
+            if table not in existing_tables:
+                continue
+            op.create_index(
+                name,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_using=using,
+                postgresql_where=sa.text(where) if where else None,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, _, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table, if_exists=True, postgresql_concurrently=True
+            )
@@ -0,0 +1,62 @@
+"""use composite social post log indexes
+
+Revision ID: f3b8d5a1c7e9
+Revises: e1a7c3b9d2f4
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b8d5a1c7e9"
+down_revision: Union[str, Sequence[str], None] = "e1a7c3b9d2f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Single-column indexes from 1cf2ab5a8998 that the composites replace
+SINGLE_INDEXES = (
+    ("ix_social_post_logs_platform", ["platform"]),
+    ("ix_social_post_logs_post_type", ["post_type"]),
+    ("ix_social_post_logs_status", ["status"]),
+    ("ix_social_post_logs_posted_at", ["posted_at"]),
+)
+
+# (platform, posted_at) serves the metrics refresh, which filters on
+# platform = 'twitter' and a posted_at cutoff; nothing filters on status
+COMPOSITE_INDEXES = (
+    ("ix_social_post_logs_platform_post_type", ["platform", "post_type"]),
+    ("ix_social_post_logs_platform_posted_at", ["platform", "posted_at"]),
+)
+
+
+def _swap_indexes(create: tuple, drop: tuple) -> None:
+    # CONCURRENTLY keeps writers unblocked but cannot run in a transaction
+    with op.get_context().autocommit_block():
+        for name, columns in create:
+            op.create_index(
+                name,
+                "social_post_logs",
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+        for name, _ in drop:
+            op.drop_index(
+                name,
+                table_name="social_post_logs",
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _swap_indexes(create=COMPOSITE_INDEXES, drop=SINGLE_INDEXES)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _swap_indexes(create=SINGLE_INDEXES, drop=COMPOSITE_INDEXES)
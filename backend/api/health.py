@@ -1,30 +1,134 @@
 import asyncio
 import os
 import time
-from datetime import datetime
-from typing import Any, Dict
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
 
+import orjson
 import psutil
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
 
-from utils.database import get_db
+from utils.database import db_manager
 from utils.logging import logger
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Fixed for the lifetime of the process
+APP_VERSION = os.getenv("APP_VERSION", "1.0.0")
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+_APPLICATION_INFO = {
+    "version": APP_VERSION,
+    "environment": ENVIRONMENT,
+    "status": "healthy",
+}
+
+# Seconds a system metrics snapshot is reused across checks and scrapes
+SYSTEM_METRICS_TTL = 2.0
+
+_GB = 1 << 30
+_MB = 1 << 20
+_INV_GB = 1.0 / _GB
+_INV_MB = 1.0 / _MB
+_INV_HOUR = 1.0 / 3600
+
+# Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+_SYSTEM_METRICS_TEMPLATE = (
+    "system_cpu_usage_percent {cpu}\n"
+    "system_memory_usage_percent {memory_percent}\n"
+    "system_memory_used_bytes {memory_used}\n"
+    "system_disk_usage_percent {disk_percent}\n"
+    "system_disk_used_bytes {disk_used}\n"
+)
+_APPLICATION_METRICS_TEMPLATE = "application_uptime_seconds {uptime}\n"
+
+# Seconds a serialized probe body (/health, /health/live) is reused; the
+# timestamp has one-second resolution as far as probes are concerned
+PROBE_CACHE_TTL = 1.0
+
+# (epoch second, formatted timestamp) shared by every endpoint
+_timestamp_cache = [0, ""]
+
+# Upper bound for each component check in /health/detailed and /health/ready
+HEALTH_CHECK_TIMEOUT = 2.0
+# Third-party status rarely flips; reuse the last external API result
+EXTERNAL_APIS_CACHE_TTL = 30.0
+
+# Connections reserved for health probes, separate from the request pool
+HEALTH_DB_POOL_SIZE = 2
+HEALTH_DB_POOL_TIMEOUT = 5
 
 
 class HealthChecker:
     def __init__(self):
-        self.start_time = time.time()
-
-    async def check_database(self, db: Session) -> Dict[str, Any]:
+        # Monotonic so uptime is unaffected by wall-clock adjustments; integer
+        # nanoseconds keep full precision until the value is emitted
+        self._start_ns = time.monotonic_ns()
+        # cpu_percent(interval=None) reports usage since the previous call;
+        # prime it so the first reading covers the time since startup
+        psutil.cpu_percent(interval=None)
+        # One handle for the whole process lifetime; Process.cpu_percent()
+        # likewise measures against its previous call on the same handle
+        self._process = psutil.Process()
+        self._process.cpu_percent()
+        # Capacity does not change while the process runs
+        self._memory_total_gb = round(psutil.virtual_memory().total * _INV_GB, 2)
+        self._disk_total = psutil.disk_usage("/").total
+        self._disk_total_gb = round(self._disk_total * _INV_GB, 2)
+        self._system_metrics = None
+        self._system_metrics_at = 0.0
+        self._db_engine = None
+        self._probe_cache: Dict[str, Tuple[float, bytes]] = {}
+        self._external_apis: Optional[Tuple[float, Dict[str, Any]]] = None
+
+    def _get_db_engine(self) -> Engine:
+        """Engine used only for database health probes"""
+        if self._db_engine is None:
+            if db_manager.database_url.startswith("sqlite"):
+                # File SQLite uses NullPool (a fresh connection per checkout), so
+                # probes cannot starve API requests of pooled connections; an
+                # in-memory database only exists on the main engine's StaticPool
+                self._db_engine = db_manager.engine
+            else:
+                self._db_engine = create_engine(
+                    db_manager.database_url,
+                    future=True,
+                    poolclass=QueuePool,
+                    pool_size=HEALTH_DB_POOL_SIZE,
+                    max_overflow=0,
+                    pool_timeout=HEALTH_DB_POOL_TIMEOUT,
+                    pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "3600")),
+                )
+        return self._db_engine
+
+    def probe_body(self, status: str, message: Optional[str] = None) -> bytes:
+        """Pre-serialized JSON body for liveness-style probes"""
+        now = time.monotonic()
+        cached = self._probe_cache.get(status)
+        if cached is not None and now - cached[0] < PROBE_CACHE_TTL:
+            return cached[1]
+
+        payload = {"status": status, "timestamp": _iso_now()}
+        if message:
+            payload["message"] = message
+        body = orjson.dumps(payload)
+        self._probe_cache[status] = (now, body)
+        return body
+
+    def _ping_database(self) -> None:
+        with self._get_db_engine().connect() as conn:
+            conn.execute(text("SELECT 1")).scalar()
+
+    async def check_database(self) -> Dict[str, Any]:
         """Check database connectivity and performance"""
         try:
             start_time = time.time()
-            # Simple query to test database connection
-            result = db.execute("SELECT 1").fetchone()
+            # Simple query to test database connection, off the event loop
+            await asyncio.to_thread(self._ping_database)
             response_time = (time.time() - start_time) * 1000
 
             return {
@@ -56,6 +160,13 @@ class HealthChecker:
 
     async def check_external_apis(self) -> Dict[str, Any]:
         """Check external API dependencies"""
+        now = time.monotonic()
+        if (
+            self._external_apis is not None
+            and now - self._external_apis[0] < EXTERNAL_APIS_CACHE_TTL
+        ):
+            return self._external_apis[1]
+
         try:
             # Check Stripe API
             stripe_status = await self._check_stripe_api()
@@ -63,7 +174,7 @@ class HealthChecker:
             # Check email service
             email_status = await self._check_email_service()
 
-            return {
+            result = {
                 "status": (
                     "healthy"
                     if all(
@@ -74,6 +185,8 @@ class HealthChecker:
                 "services": {"stripe": stripe_status, "email": email_status},
                 "message": "External APIs checked",
             }
+            self._external_apis = (now, result)
+            return result
         except Exception as e:
             logger.error("External APIs health check failed", exc_info=True)
             return {
@@ -118,9 +231,16 @@ class HealthChecker:
 
     def get_system_metrics(self) -> Dict[str, Any]:
         """Get system resource metrics"""
+        now = time.monotonic()
+        if (
+            self._system_metrics is not None
+            and now - self._system_metrics_at < SYSTEM_METRICS_TTL
+        ):
+            return self._system_metrics
+
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU usage since the previous sample; never sleeps
+            cpu_percent = psutil.cpu_percent(interval=None)
 
             # Memory usage
             memory = psutil.virtual_memory()
@@ -129,10 +249,11 @@ class HealthChecker:
             disk = psutil.disk_usage("/")
 
             # Process info
-            process = psutil.Process()
+            process = self._process
             process_memory = process.memory_info()
+            disk_ratio = disk.used / self._disk_total
 
-            return {
+            metrics = {
                 "cpu": {
                     "usage_percent": cpu_percent,
                     "status": (
@@ -142,9 +263,9 @@ class HealthChecker:
                     ),
                 },
                 "memory": {
-                    "total_gb": round(memory.total / (1024**3), 2),
-                    "used_gb": round(memory.used / (1024**3), 2),
-                    "available_gb": round(memory.available / (1024**3), 2),
+                    "total_gb": self._memory_total_gb,
+                    "used_gb": round(memory.used * _INV_GB, 2),
+                    "available_gb": round(memory.available * _INV_GB, 2),
                     "usage_percent": memory.percent,
                     "status": (
                         "healthy"
@@ -153,20 +274,18 @@ class HealthChecker:
                     ),
                 },
                 "disk": {
-                    "total_gb": round(disk.total / (1024**3), 2),
-                    "used_gb": round(disk.used / (1024**3), 2),
-                    "free_gb": round(disk.free / (1024**3), 2),
-                    "usage_percent": round((disk.used / disk.total) * 100, 2),
+                    "total_gb": self._disk_total_gb,
+                    "used_gb": round(disk.used * _INV_GB, 2),
+                    "free_gb": round(disk.free * _INV_GB, 2),
+                    "usage_percent": round(disk_ratio * 100, 2),
                     "status": (
                         "healthy"
-                        if (disk.used / disk.total) < 0.8
-                        else (
-                            "warning" if (disk.used / disk.total) < 0.95 else "critical"
-                        )
+                        if disk_ratio < 0.8
+                        else ("warning" if disk_ratio < 0.95 else "critical")
                     ),
                 },
                 "process": {
-                    "memory_mb": round(process_memory.rss / (1024**2), 2),
+                    "memory_mb": round(process_memory.rss * _INV_MB, 2),
                     "cpu_percent": process.cpu_percent(),
                     "threads": process.num_threads(),
                     "status": "healthy",
@@ -176,23 +295,57 @@ class HealthChecker:
             logger.error("Failed to get system metrics", exc_info=True)
             return {"error": str(e), "status": "unhealthy"}
 
+        self._system_metrics = metrics
+        self._system_metrics_at = now
+        return metrics
+
     def get_application_metrics(self) -> Dict[str, Any]:
         """Get application-specific metrics"""
         try:
-            uptime = time.time() - self.start_time
+            uptime = (time.monotonic_ns() - self._start_ns) * 1e-9
 
             return {
-                "uptime_seconds": round(uptime, 2),
-                "uptime_hours": round(uptime / 3600, 2),
-                "version": os.getenv("APP_VERSION", "1.0.0"),
-                "environment": os.getenv("ENVIRONMENT", "development"),
-                "status": "healthy",
-            }
+                "uptime_seconds": uptime,
+                "uptime_hours": uptime * _INV_HOUR,
+            } | _APPLICATION_INFO
         except Exception as e:
             logger.error("Failed to get application metrics", exc_info=True)
             return {"error": str(e), "status": "unhealthy"}
 
 
+def _iso_now() -> str:
+    """UTC ISO-8601 timestamp, formatted at most once per second"""
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache[1] = datetime.fromtimestamp(now, tz=timezone.utc).isoformat()
+        _timestamp_cache[0] = now
+    return _timestamp_cache[1]
+
+
+async def _bounded_check(
+    check, name: str, timeout_status: str = "unhealthy"
+) -> Dict[str, Any]:
+    """Await one component check under HEALTH_CHECK_TIMEOUT; never raises"""
+    try:
+        return await asyncio.wait_for(check, timeout=HEALTH_CHECK_TIMEOUT)
+    except asyncio.TimeoutError:
+        return {"status": timeout_status, "message": f"{name} check timed out"}
+    except Exception as e:
+        return {"status": "unhealthy", "error": str(e)}
+
+
+def _overall_status(checks) -> str:
+    """Reduce component statuses in one pass; any unhealthy check wins"""
+    overall = "healthy"
+    for check in checks:
+        status = check.get("status")
+        if status == "unhealthy":
+            return status
+        if status == "degraded":
+            overall = status
+    return overall
+
+
 # Global health checker instance
 health_checker = HealthChecker()
 
@@ -200,69 +353,74 @@ health_checker = HealthChecker()
 @router.get("/health")
 async def health_check():
     """Basic health check endpoint"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "message": "Service is running",
-    }
+    return Response(
+        content=health_checker.probe_body("healthy", "Service is running"),
+        media_type="application/json",
+    )
 
 
 @router.get("/health/detailed")
-async def detailed_health_check(db: Session = Depends(get_db)):
+async def detailed_health_check():
     """Detailed health check with all components"""
     try:
-        # Run all health checks in parallel
-        db_check, redis_check, external_apis_check = await asyncio.gather(
-            health_checker.check_database(db),
-            health_checker.check_redis(),
-            health_checker.check_external_apis(),
-            return_exceptions=True,
+        # Run all health checks and the metrics sample in parallel
+        metrics_task = asyncio.create_task(
+            asyncio.to_thread(health_checker.get_system_metrics)
         )
+        tasks = {
+            "database": asyncio.create_task(
+                _bounded_check(health_checker.check_database(), "Database")
+            ),
+            "redis": asyncio.create_task(
+                _bounded_check(health_checker.check_redis(), "Redis")
+            ),
+            "external_apis": asyncio.create_task(
+                _bounded_check(
+                    health_checker.check_external_apis(),
+                    "External APIs",
+                    # A slow third party degrades the service, it does not
+                    # take it down
+                    timeout_status="degraded",
+                )
+            ),
+        }
 
-        # Get system metrics
-        system_metrics = health_checker.get_system_metrics()
+        # A failed database makes the service unhealthy regardless of the
+        # rest, so stop waiting on slower checks as soon as it reports
+        db_task = tasks["database"]
+        pending = set(tasks.values())
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            if db_task in done and db_task.result()["status"] == "unhealthy":
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                break
+
+        checks = {
+            name: (
+                task.result()
+                if not task.cancelled()
+                else {"status": "skipped", "message": "Database unavailable"}
+            )
+            for name, task in tasks.items()
+        }
+
+        try:
+            system_metrics = await metrics_task
+        except Exception as e:
+            system_metrics = {"error": str(e), "status": "unhealthy"}
         app_metrics = health_checker.get_application_metrics()
 
-        # Determine overall status
-        checks = [db_check, redis_check, external_apis_check]
-        if any(isinstance(check, Exception) for check in checks):
-            overall_status = "unhealthy"
-        elif any(
-            check.get("status") == "unhealthy"
-            for check in checks
-            if isinstance(check, dict)
-        ):
-            overall_status = "unhealthy"
-        elif any(
-            check.get("status") == "degraded"
-            for check in checks
-            if isinstance(check, dict)
-        ):
-            overall_status = "degraded"
-        else:
-            overall_status = "healthy"
+        overall_status = _overall_status(checks.values())
 
         # Prepare response
         response = {
             "status": overall_status,
-            "timestamp": datetime.utcnow().isoformat(),
-            "checks": {
-                "database": (
-                    db_check
-                    if not isinstance(db_check, Exception)
-                    else {"status": "unhealthy", "error": str(db_check)}
-                ),
-                "redis": (
-                    redis_check
-                    if not isinstance(redis_check, Exception)
-                    else {"status": "unhealthy", "error": str(redis_check)}
-                ),
-                "external_apis": (
-                    external_apis_check
-                    if not isinstance(external_apis_check, Exception)
-                    else {"status": "unhealthy", "error": str(external_apis_check)}
-                ),
-            },
+            "timestamp": _iso_now(),
+            "checks": checks,
             "system": system_metrics,
             "application": app_metrics,
         }
@@ -274,14 +432,14 @@ async def detailed_health_check(db: Session = Depends(get_db)):
             else 503 if overall_status == "unhealthy" else 200
         )
 
-        return JSONResponse(content=response, status_code=status_code)
+        return ORJSONResponse(content=response, status_code=status_code)
 
     except Exception as e:
         logger.error("Health check failed", exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "status": "unhealthy",
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": _iso_now(),
                 "error": str(e),
                 "message": "Health check failed",
             },
@@ -290,16 +448,16 @@ async def detailed_health_check(db: Session = Depends(get_db)):
 
 
 @router.get("/health/ready")
-async def readiness_check(db: Session = Depends(get_db)):
+async def readiness_check():
     """Kubernetes readiness probe"""
     try:
         # Check critical dependencies
-        db_check = await health_checker.check_database(db)
+        db_check = await _bounded_check(health_checker.check_database(), "Database")
 
         if db_check["status"] != "healthy":
             raise HTTPException(status_code=503, detail="Service not ready")
 
-        return {"status": "ready", "timestamp": datetime.utcnow().isoformat()}
+        return {"status": "ready", "timestamp": _iso_now()}
 
     except Exception as e:
         logger.error("Readiness check failed", exc_info=True)
@@ -316,7 +474,9 @@ async def liveness_check():
         if app_metrics["status"] != "healthy":
             raise HTTPException(status_code=503, detail="Service not alive")
 
-        return {"status": "alive", "timestamp": datetime.utcnow().isoformat()}
+        return Response(
+            content=health_checker.probe_body("alive"), media_type="application/json"
+        )
 
     except Exception as e:
         logger.error("Liveness check failed", exc_info=True)
@@ -330,38 +490,21 @@ async def metrics_endpoint():
         system_metrics = health_checker.get_system_metrics()
         app_metrics = health_checker.get_application_metrics()
 
-        # Format as Prometheus metrics
-        metrics = []
-
-        # System metrics
-        if "cpu" in system_metrics:
-            metrics.append(
-                f"system_cpu_usage_percent {system_metrics['cpu']['usage_percent']}"
-            )
-
-        if "memory" in system_metrics:
-            metrics.append(
-                f"system_memory_usage_percent {system_metrics['memory']['usage_percent']}"
+        body = ""
+        if "error" not in system_metrics:
+            body = _SYSTEM_METRICS_TEMPLATE.format(
+                cpu=system_metrics["cpu"]["usage_percent"],
+                memory_percent=system_metrics["memory"]["usage_percent"],
+                memory_used=system_metrics["memory"]["used_gb"] * _GB,
+                disk_percent=system_metrics["disk"]["usage_percent"],
+                disk_used=system_metrics["disk"]["used_gb"] * _GB,
             )
-            metrics.append(
-                f"system_memory_used_bytes {system_metrics['memory']['used_gb'] * 1024**3}"
-            )
-
-        if "disk" in system_metrics:
-            metrics.append(
-                f"system_disk_usage_percent {system_metrics['disk']['usage_percent']}"
-            )
-            metrics.append(
-                f"system_disk_used_bytes {system_metrics['disk']['used_gb'] * 1024**3}"
-            )
-
-        # Application metrics
         if "uptime_seconds" in app_metrics:
-            metrics.append(
-                f"application_uptime_seconds {app_metrics['uptime_seconds']}"
+            body += _APPLICATION_METRICS_TEMPLATE.format(
+                uptime=app_metrics["uptime_seconds"]
             )
 
-        return "\n".join(metrics)
+        return PlainTextResponse(body, media_type=PROMETHEUS_CONTENT_TYPE)
 
     except Exception as e:
         logger.error("Metrics endpoint failed", exc_info=True)
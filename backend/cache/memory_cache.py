@@ -6,209 +6,361 @@ Redisが利用できない場合のフォールバック用メモリキャッシ
 import logging
 import threading
 import time
-from collections import OrderedDict
-from typing import Any, Dict, Optional, Tuple
+import weakref
+from contextlib import ExitStack
+from typing import Any, Dict, Hashable, Optional
+
+from cache.singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+_NS_PER_SECOND = 1_000_000_000
+# GCLOCK の参照カウンタ上限（追い出しを免れる巡回回数の上限）
+_MAX_COUNT = 3
+_STAT_KEYS = ("hits", "misses", "evictions", "sets", "deletes")
+# 期限切れエントリをまとめて削除する間隔（秒）
+CLEANUP_INTERVAL = 10.0
+# キーワード引数の区切り（functools の実装と同じ）
+_KWD_MARK = (object(),)
 
-class MemoryCache:
-    """メモリキャッシュクラス（LRU実装）"""
 
-    def __init__(self, max_size: int = 1000, default_ttl: int = 300):
-        """メモリキャッシュの初期化"""
+class _HashedSeq(list):
+    """ハッシュ値を1度だけ計算して保持するキー（functools._HashedSeq と同等）"""
+
+    __slots__ = ("hashvalue",)
+
+    def __init__(self, tup: tuple):
+        self[:] = tup
+        self.hashvalue = hash(tup)
+
+    def __hash__(self):
+        return self.hashvalue
+
+
+def _make_key(args: tuple, kwargs: dict) -> Hashable:
+    """引数からキャッシュキーを作る（functools._make_key の typed=False 相当）
+
+    非公開の標準ライブラリ関数に依存しないよう、同じ処理をここに持つ。
+    """
+    key = args
+    if kwargs:
+        key += _KWD_MARK
+        for item in kwargs.items():
+            key += item
+    if len(key) == 1 and type(key[0]) in {int, str}:
+        return key[0]
+    return _HashedSeq(key)
+
+
+class _Entry:
+    """キャッシュエントリ（値・有効期限・参照カウンタ）"""
+
+    __slots__ = ("value", "expires_at", "count")
+
+    def __init__(self, value: Any, expires_at: int):
+        self.value = value
+        # time.monotonic_ns() 基準の整数ナノ秒
+        self.expires_at = expires_at
+        # 読み取りごとに加算し、追い出しの巡回で減算する（GCLOCK方式）
+        self.count = 0
+
+
+class _Shard:
+    """キャッシュの1ストライプ（独立したdict・ロック・統計）"""
+
+    __slots__ = (
+        "entries",
+        "lock",
+        "max_size",
+        "hits",
+        "misses",
+        "evictions",
+        "sets",
+        "deletes",
+    )
+
+    def __init__(self, max_size: int):
+        # dict は挿入順を保持するため、先頭が最も古いエントリになる
+        self.entries: Dict[Hashable, _Entry] = {}
+        # ロック保持中に別のロック取得メソッドを呼ばないため、再入可能でなくてよい
+        self.lock = threading.Lock()
         self.max_size = max_size
-        self.default_ttl = default_ttl
-        self._cache: OrderedDict[str, Tuple[Any, float]] = OrderedDict()
-        self._lock = threading.RLock()
-        self._stats = {
-            "hits": 0,
-            "misses": 0,
-            "evictions": 0,
-            "sets": 0,
-            "deletes": 0,
-        }
+        # 統計は dict ではなく属性で持ち、加算を属性の更新1回で済ませる
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.sets = 0
+        self.deletes = 0
 
-    def _is_expired(self, timestamp: float) -> bool:
+
+class MemoryCache:
+    """メモリキャッシュクラス（LRU実装）
+
+    キーのハッシュで選ばれるシャードごとにロックを持つため、別シャードの
+    キーへのアクセスは互いに待たない。ヒット時の読み取りはロックを取らず
+    （CPython の dict 読み取りは GIL 下でアトミック）、参照カウンタを増やす
+    だけにする。追い出しはシャード単位の GCLOCK 方式による近似 LRU で、
+    よく読まれるエントリほど多くの巡回を生き残る。
+    ヒット数などの統計もロックなしで加算するため概算値となる。
+    """
+
+    __slots__ = (
+        "max_size",
+        "default_ttl",
+        "_shard_mask",
+        "_shards",
+        "_stop_cleanup",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        default_ttl: int = 300,
+        shards: int = 16,
+        cleanup_interval: Optional[float] = CLEANUP_INTERVAL,
+    ):
+        """メモリキャッシュの初期化
+
+        cleanup_interval 秒ごとにバックグラウンドで期限切れエントリを削除する
+        （None または 0 なら参照時の個別削除のみ）。
+        """
+        if shards < 1 or shards & (shards - 1):
+            raise ValueError("shards must be a power of two")
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        # 容量0のシャードができないよう、シャード数は max_size 以下に抑える
+        while shards > 1 and shards > max_size:
+            shards //= 2
+        self._shard_mask = shards - 1
+        # 合計がちょうど max_size になるよう、端数は先頭のシャードに1件ずつ配る
+        base, extra = divmod(max_size, shards)
+        self._shards = tuple(_Shard(base + (i < extra)) for i in range(shards))
+
+        self._stop_cleanup = threading.Event()
+        if cleanup_interval:
+            threading.Thread(
+                target=_periodic_cleanup,
+                args=(weakref.ref(self), self._stop_cleanup, cleanup_interval),
+                name="memory-cache-cleanup",
+                daemon=True,
+            ).start()
+
+    def _shard(self, key: Hashable) -> _Shard:
+        return self._shards[hash(key) & self._shard_mask]
+
+    def _is_expired(self, expires_at: int) -> bool:
         """有効期限の確認"""
-        return time.time() > timestamp
-
-    def _cleanup_expired(self):
-        """期限切れのエントリを削除"""
-        current_time = time.time()
-        expired_keys = []
-
-        for key, (_, timestamp) in self._cache.items():
-            if current_time > timestamp:
-                expired_keys.append(key)
-
-        for key in expired_keys:
-            del self._cache[key]
-            self._stats["evictions"] += 1
-
-    def _evict_lru(self):
-        """LRUエントリを削除"""
-        if self._cache:
-            # 最も古いエントリを削除
-            key, _ = self._cache.popitem(last=False)
-            self._stats["evictions"] += 1
+        return time.monotonic_ns() > expires_at
+
+    def _evict_lru(self, shard: _Shard):
+        """LRUエントリを削除（GCLOCK方式）"""
+        entries = shard.entries
+        while entries:
+            # dict の先頭を針とし、カウンタが残っていれば減算して末尾へ回す
+            key = next(iter(entries))
+            entry = entries.pop(key)
+            if entry.count:
+                entry.count -= 1
+                entries[key] = entry
+                continue
+
+            shard.evictions += 1
             logger.debug(f"Evicted LRU key: {key}")
+            return
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None) -> bool:
         """キャッシュに値を設定"""
-        with self._lock:
-            try:
-                # 期限切れエントリのクリーンアップ
-                self._cleanup_expired()
-
-                # サイズ制限の確認
-                if len(self._cache) >= self.max_size and key not in self._cache:
-                    self._evict_lru()
+        # 期限切れエントリは参照時に個別に削除する（全件走査はしない）
+        expires_at = time.monotonic_ns() + (ttl or self.default_ttl) * _NS_PER_SECOND
+        shard = self._shard(key)
+
+        with shard.lock:
+            # 既存のキーがある場合は削除してから追加（末尾へ移動）
+            entries = shard.entries
+            if entries.pop(key, None) is None and len(entries) >= shard.max_size:
+                self._evict_lru(shard)
+
+            entries[key] = _Entry(value, expires_at)
+            shard.sets += 1
+
+        logger.debug("Set cache key: %s", key)
+        return True
+
+    def _remove_expired(self, shard: _Shard, key: Hashable, entry: _Entry):
+        """期限切れエントリを削除（並行して再設定されていなければ）"""
+        with shard.lock:
+            if shard.entries.get(key) is entry:
+                del shard.entries[key]
+                shard.evictions += 1
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """キャッシュから値を取得"""
+        shard = self._shard(key)
 
-                # 有効期限の設定
-                expire_time = time.time() + (ttl or self.default_ttl)
+        # ヒット時はロックを取らない
+        entry = shard.entries.get(key)
+        if entry is None:
+            shard.misses += 1
+            return None
 
-                # 既存のキーがある場合は削除してから追加
-                if key in self._cache:
-                    del self._cache[key]
+        # 有効期限の確認
+        if self._is_expired(entry.expires_at):
+            self._remove_expired(shard, key, entry)
+            shard.misses += 1
+            return None
 
-                # 新しいエントリを追加
-                self._cache[key] = (value, expire_time)
-                self._stats["sets"] += 1
+        if entry.count < _MAX_COUNT:
+            entry.count += 1
+        shard.hits += 1
 
-                logger.debug(f"Set cache key: {key}")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to set cache key {key}: {e}")
-                return False
+        logger.debug("Cache hit for key: %s", key)
+        return entry.value
 
-    def get(self, key: str) -> Optional[Any]:
-        """キャッシュから値を取得"""
-        with self._lock:
-            try:
-                if key not in self._cache:
-                    self._stats["misses"] += 1
-                    return None
-
-                value, timestamp = self._cache[key]
-
-                # 有効期限の確認
-                if self._is_expired(timestamp):
-                    del self._cache[key]
-                    self._stats["misses"] += 1
-                    self._stats["evictions"] += 1
-                    return None
-
-                # LRUの更新（アクセスされたエントリを最後に移動）
-                self._cache.move_to_end(key)
-                self._stats["hits"] += 1
-
-                logger.debug(f"Cache hit for key: {key}")
-                return value
-            except Exception as e:
-                logger.error(f"Failed to get cache key {key}: {e}")
-                self._stats["misses"] += 1
-                return None
-
-    def delete(self, key: str) -> bool:
+    def delete(self, key: Hashable) -> bool:
         """キャッシュから値を削除"""
-        with self._lock:
-            try:
-                if key in self._cache:
-                    del self._cache[key]
-                    self._stats["deletes"] += 1
-                    logger.debug(f"Deleted cache key: {key}")
-                    return True
-                return False
-            except Exception as e:
-                logger.error(f"Failed to delete cache key {key}: {e}")
+        shard = self._shard(key)
+
+        with shard.lock:
+            if shard.entries.pop(key, None) is None:
                 return False
+            shard.deletes += 1
+
+        logger.debug(f"Deleted cache key: {key}")
+        return True
 
-    def exists(self, key: str) -> bool:
+    def exists(self, key: Hashable) -> bool:
         """キャッシュキーの存在確認"""
-        with self._lock:
-            if key not in self._cache:
-                return False
+        shard = self._shard(key)
 
-            _, timestamp = self._cache[key]
-            if self._is_expired(timestamp):
-                del self._cache[key]
-                return False
+        entry = shard.entries.get(key)
+        if entry is None:
+            return False
 
-            return True
+        if self._is_expired(entry.expires_at):
+            self._remove_expired(shard, key, entry)
+            return False
+
+        return True
 
     def clear(self) -> bool:
         """全キャッシュをクリア"""
-        with self._lock:
-            try:
-                self._cache.clear()
-                logger.info("Cache cleared")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to clear cache: {e}")
-                return False
+        # デッドロックを避けるため、常にシャード順にロックを取得する
+        with ExitStack() as stack:
+            for shard in self._shards:
+                stack.enter_context(shard.lock)
+            for shard in self._shards:
+                shard.entries.clear()
+
+        logger.info("Cache cleared")
+        return True
 
     def get_stats(self) -> Dict[str, Any]:
         """キャッシュ統計情報の取得"""
-        with self._lock:
-            total_requests = self._stats["hits"] + self._stats["misses"]
-            hit_rate = (
-                (self._stats["hits"] / total_requests * 100)
-                if total_requests > 0
-                else 0.0
-            )
-
-            return {
-                "size": len(self._cache),
-                "max_size": self.max_size,
-                "hits": self._stats["hits"],
-                "misses": self._stats["misses"],
-                "hit_rate": round(hit_rate, 2),
-                "evictions": self._stats["evictions"],
-                "sets": self._stats["sets"],
-                "deletes": self._stats["deletes"],
-            }
+        totals = dict.fromkeys(_STAT_KEYS, 0)
+        size = 0
+        for shard in self._shards:
+            with shard.lock:
+                size += len(shard.entries)
+                for name in _STAT_KEYS:
+                    totals[name] += getattr(shard, name)
+
+        total_requests = totals["hits"] + totals["misses"]
+        hit_rate = (
+            (totals["hits"] / total_requests * 100) if total_requests > 0 else 0.0
+        )
+
+        return {
+            "size": size,
+            "max_size": self.max_size,
+            "hits": totals["hits"],
+            "misses": totals["misses"],
+            "hit_rate": round(hit_rate, 2),
+            "evictions": totals["evictions"],
+            "sets": totals["sets"],
+            "deletes": totals["deletes"],
+        }
+
+    def _purge_expired(self, shard: _Shard, now: int):
+        """期限切れエントリをまとめて削除（呼び出し側でロックを保持）"""
+        entries = shard.entries
+        # 1件ずつ del せず、有効なエントリだけで dict を作り直す（順序は維持）
+        live = {key: entry for key, entry in entries.items() if now <= entry.expires_at}
+        if len(live) != len(entries):
+            shard.evictions += len(entries) - len(live)
+            shard.entries = live
+
+    def cleanup_expired(self):
+        """全シャードの期限切れエントリを削除（ロックはシャードごとに短く保持）"""
+        now = time.monotonic_ns()
+        for shard in self._shards:
+            with shard.lock:
+                self._purge_expired(shard, now)
+
+    def close(self):
+        """バックグラウンドの定期削除を停止"""
+        self._stop_cleanup.set()
 
     def get_keys(self) -> list:
         """キャッシュキーの一覧取得"""
-        with self._lock:
-            current_time = time.time()
-            valid_keys = []
+        now = time.monotonic_ns()
+        valid_keys = []
 
-            for key, (_, timestamp) in self._cache.items():
-                if current_time <= timestamp:
-                    valid_keys.append(key)
-                else:
-                    # 期限切れのキーを削除
-                    del self._cache[key]
-                    self._stats["evictions"] += 1
+        for shard in self._shards:
+            with shard.lock:
+                self._purge_expired(shard, now)
+                valid_keys.extend(shard.entries)
 
-            return valid_keys
+        return valid_keys
+
+
+def _periodic_cleanup(
+    cache_ref: "weakref.ref[MemoryCache]", stop: threading.Event, interval: float
+):
+    """定期削除スレッド本体（キャッシュが不要になれば weakref 経由で終了する）"""
+    while not stop.wait(interval):
+        cache = cache_ref()
+        if cache is None:
+            return
+        cache.cleanup_expired()
+        del cache
 
 
 # グローバルメモリキャッシュインスタンス
 memory_cache = MemoryCache(max_size=1000, default_ttl=300)
 
 
+# 実行中の関数呼び出し（キャッシュミス時の重複実行を防ぐ）
+_inflight = SingleFlight()
+
+
 # デコレータ関数
 def memory_cache_result(ttl: int = 300):
     """関数の結果をメモリキャッシュするデコレータ"""
 
     def decorator(func):
         def wrapper(*args, **kwargs):
-            # キャッシュキーの生成
-            key = f"{func.__name__}:{hash(str(args) + str(sorted(kwargs.items())))}"
+            # キャッシュキーの生成（引数を文字列化せず、そのままタプルをキーにする）
+            try:
+                key = (func.__qualname__, _make_key(args, kwargs))
+                hash(key)
+            except TypeError:
+                # ハッシュ不可能な引数は従来どおり文字列化する
+                key = f"{func.__qualname__}:{args!r}:{sorted(kwargs.items())!r}"
 
             # キャッシュから取得を試行
             cached_result = memory_cache.get(key)
             if cached_result is not None:
                 return cached_result
 
-            # 関数を実行して結果をキャッシュ
-            result = func(*args, **kwargs)
-            memory_cache.set(key, result, ttl)
+            def compute():
+                # 関数を実行して結果をキャッシュ
+                result = func(*args, **kwargs)
+                memory_cache.set(key, result, ttl)
+                return result
 
-            return result
+            # 同じキーの計算が実行中なら、その結果を待つ
+            return _inflight.do(key, compute)
 
         return wrapper
 
@@ -3,20 +3,141 @@ Redis Cache Implementation
 高性能なキャッシュシステムの実装
 """
 
+import functools
 import hashlib
+import importlib
+import inspect
 import json
 import logging
 import os
 import pickle
+import socket
+import sys
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Union
 
+import orjson
 import redis
+import redis.asyncio as aioredis
+
+from cache.singleflight import AsyncSingleFlight, SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# 値の先頭に付ける形式タグ（JSON テキストは J/P/M で始まらないため旧形式と区別できる）
+_JSON_TAG = b"J"
+_PICKLE_TAG = b"P"
+# pydantic モデル（クラスのパスと model_dump_json の出力。読み出し時にモデルへ戻す）
+_MODEL_TAG = b"M"
+
+# 接続プールの上限（ワーカー内の同時実行数に合わせて調整）
+REDIS_POOL_SIZE = int(os.getenv("REDIS_POOL", "64"))
+# アイドル接続の死活確認を60秒で開始（TCP_KEEPIDLE は Linux のみ）
+_KEEPALIVE_OPTIONS = (
+    {socket.TCP_KEEPIDLE: 60} if hasattr(socket, "TCP_KEEPIDLE") else {}
+)
+
+# SCAN 1回あたりの取得件数と、まとめて UNLINK するキー数
+SCAN_BATCH_SIZE = 500
+
+
+def _pool_options(
+    host: str,
+    port: int,
+    db: int,
+    password: Optional[str],
+    decode_responses: bool,
+) -> Dict[str, Any]:
+    """同期・非同期の接続プールで共通の接続設定"""
+    return dict(
+        host=host,
+        port=port,
+        db=db,
+        password=password,
+        decode_responses=decode_responses,
+        max_connections=REDIS_POOL_SIZE,
+        socket_connect_timeout=5,
+        socket_timeout=5,
+        socket_keepalive=True,
+        socket_keepalive_options=_KEEPALIVE_OPTIONS,
+        retry_on_timeout=True,
+        health_check_interval=30,
+    )
+
+
+def _encode_model(data: Any) -> Optional[bytes]:
+    """pydantic モデルなら自身の JSON シリアライザでクラスのパス付きにエンコードする"""
+    model_dump_json = getattr(data, "model_dump_json", None)
+    if model_dump_json is None:
+        return None
+    model = type(data)
+    # 関数内のクラスやジェネリックの具象化はインポートで復元できないため対象外
+    if not all(name.isidentifier() for name in model.__qualname__.split(".")):
+        return None
+    path = f"{model.__module__}:{model.__qualname__}".encode()
+    return _MODEL_TAG + path + b"\n" + model_dump_json().encode()
+
+
+def _decode_model(payload: bytes) -> Any:
+    """_encode_model で保存した値を元のモデルクラスで復元する"""
+    path, _, raw = payload.partition(b"\n")
+    module_name, _, qualname = path.decode().partition(":")
+    model = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        model = getattr(model, name)
+    return model.model_validate_json(raw)
+
+
+class _RedisCodec:
+    """同期・非同期キャッシュで共通のシリアライズとキー生成"""
+
+    def __init__(self):
+        self._prefixes: Dict[str, str] = {}
+
+    def _serialize(self, data: Any) -> bytes:
+        """データのシリアライズ（先頭1バイトで形式を区別）"""
+        # pydantic モデルは model_dump_json で1回だけエンコードし、型ごと保存する
+        encoded = _encode_model(data)
+        if encoded is not None:
+            return encoded
+        try:
+            return _JSON_TAG + orjson.dumps(data)
+        except TypeError:
+            # JSON にできない値は pickle のバイト列をそのまま保存する
+            return _PICKLE_TAG + pickle.dumps(data, protocol=5)
 
-class RedisCache:
+    def _deserialize(self, data: bytes) -> Any:
+        """データのデシリアライズ"""
+        tag, payload = data[:1], data[1:]
+        if tag == _JSON_TAG:
+            return orjson.loads(payload)
+        if tag == _PICKLE_TAG:
+            return pickle.loads(payload)
+        if tag == _MODEL_TAG:
+            return _decode_model(payload)
+
+        # 形式タグ導入前に保存された値（JSON 文字列または16進 pickle）
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            try:
+                return pickle.loads(bytes.fromhex(data.decode()))
+            except (ValueError, pickle.PickleError):
+                return data
+
+    def _prefix(self, namespace: str) -> str:
+        """名前空間のキープレフィックス（名前空間ごとに1度だけ生成）"""
+        prefix = self._prefixes.get(namespace)
+        if prefix is None:
+            prefix = self._prefixes.setdefault(namespace, sys.intern(f"{namespace}:"))
+        return prefix
+
+    def _generate_key(self, key: str, namespace: str = "default") -> str:
+        """キャッシュキーの生成"""
+        return self._prefix(namespace) + key
+
+
+class RedisCache(_RedisCodec):
     """Redis キャッシュクラス"""
 
     def __init__(
@@ -25,21 +146,17 @@ class RedisCache:
         port: int = 6379,
         db: int = 0,
         password: Optional[str] = None,
-        decode_responses: bool = True,
+        decode_responses: bool = False,
     ):
         """Redis キャッシュの初期化"""
+        super().__init__()
         try:
-            self.redis_client = redis.Redis(
-                host=host,
-                port=port,
-                db=db,
-                password=password,
-                decode_responses=decode_responses,
-                socket_connect_timeout=5,
-                socket_timeout=5,
-                retry_on_timeout=True,
-                health_check_interval=30,
+            # プロセス内で接続を使い回すプール。hiredis がインストールされて
+            # いれば redis-py は自動的に C 実装のパーサーを使う
+            pool = redis.ConnectionPool(
+                **_pool_options(host, port, db, password, decode_responses)
             )
+            self.redis_client = redis.Redis(connection_pool=pool)
             # 接続テスト
             self.redis_client.ping()
             logger.info("Redis cache connected successfully")
@@ -47,27 +164,6 @@ class RedisCache:
             logger.error(f"Failed to connect to Redis: {e}")
             self.redis_client = None
 
-    def _serialize(self, data: Any) -> str:
-        """データのシリアライズ"""
-        try:
-            return json.dumps(data, default=str)
-        except (TypeError, ValueError):
-            return pickle.dumps(data).hex()
-
-    def _deserialize(self, data: str) -> Any:
-        """データのデシリアライズ"""
-        try:
-            return json.loads(data)
-        except (json.JSONDecodeError, TypeError):
-            try:
-                return pickle.loads(bytes.fromhex(data))
-            except (ValueError, pickle.PickleError):
-                return data
-
-    def _generate_key(self, key: str, namespace: str = "default") -> str:
-        """キャッシュキーの生成"""
-        return f"{namespace}:{key}"
-
     def set(
         self,
         key: str,
@@ -80,19 +176,37 @@ class RedisCache:
             return False
 
         try:
-            cache_key = self._generate_key(key, namespace)
-            serialized_value = self._serialize(value)
+            return self._write(key, self._serialize(value), expire, namespace)
+        except Exception as e:
+            logger.error(f"Failed to set cache key {key}: {e}")
+            return False
 
-            if expire:
-                result = self.redis_client.setex(cache_key, expire, serialized_value)
-            else:
-                result = self.redis_client.set(cache_key, serialized_value)
+    def set_raw(
+        self,
+        key: str,
+        raw: bytes,
+        expire: Optional[int] = None,
+        namespace: str = "default",
+    ) -> bool:
+        """JSON エンコード済みのバイト列をそのまま保存（get では通常どおり復元）"""
+        if not self.redis_client:
+            return False
 
-            return bool(result)
+        try:
+            return self._write(key, _JSON_TAG + raw, expire, namespace)
         except Exception as e:
             logger.error(f"Failed to set cache key {key}: {e}")
             return False
 
+    def _write(
+        self, key: str, payload: bytes, expire: Optional[int], namespace: str
+    ) -> bool:
+        """シリアライズ済みの値を書き込む"""
+        cache_key = self._generate_key(key, namespace)
+        if expire:
+            return bool(self.redis_client.setex(cache_key, expire, payload))
+        return bool(self.redis_client.set(cache_key, payload))
+
     def get(self, key: str, namespace: str = "default") -> Optional[Any]:
         """キャッシュから値を取得"""
         if not self.redis_client:
@@ -110,6 +224,52 @@ class RedisCache:
             logger.error(f"Failed to get cache key {key}: {e}")
             return None
 
+    def get_many(self, keys: List[str], namespace: str = "default") -> Dict[str, Any]:
+        """複数キーの値を1往復（MGET）で取得"""
+        if not self.redis_client or not keys:
+            return {}
+
+        try:
+            prefix = self._prefix(namespace)
+            cache_keys = [prefix + key for key in keys]
+            values = self.redis_client.mget(cache_keys)
+            return {
+                key: self._deserialize(value)
+                for key, value in zip(keys, values)
+                if value is not None
+            }
+        except Exception as e:
+            logger.error(f"Failed to get {len(keys)} cache keys: {e}")
+            return {}
+
+    def set_many(
+        self,
+        mapping: Dict[str, Any],
+        expire: Optional[int] = None,
+        namespace: str = "default",
+    ) -> bool:
+        """複数キーの値をパイプラインで1往復で設定"""
+        if not self.redis_client:
+            return False
+        if not mapping:
+            return True
+
+        try:
+            prefix = self._prefix(namespace)
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                cache_key = prefix + key
+                serialized_value = self._serialize(value)
+                if expire:
+                    pipe.setex(cache_key, expire, serialized_value)
+                else:
+                    pipe.set(cache_key, serialized_value)
+
+            return all(pipe.execute())
+        except Exception as e:
+            logger.error(f"Failed to set {len(mapping)} cache keys: {e}")
+            return False
+
     def delete(self, key: str, namespace: str = "default") -> bool:
         """キャッシュから値を削除"""
         if not self.redis_client:
@@ -165,15 +325,27 @@ class RedisCache:
             return False
 
         try:
-            pattern = f"{namespace}:*"
-            keys = self.redis_client.keys(pattern)
-            if keys:
-                return bool(self.redis_client.delete(*keys))
+            self.unlink_matching(f"{namespace}:*")
             return True
         except Exception as e:
             logger.error(f"Failed to clear namespace {namespace}: {e}")
             return False
 
+    def unlink_matching(self, pattern: str) -> int:
+        """パターンに一致するキーを SCAN で走査し UNLINK で削除
+
+        KEYS と違いサーバーをブロックせず、メモリ解放もバックグラウンドで行われる。
+        """
+        deleted = 0
+        pipe = self.redis_client.pipeline(transaction=False)
+        for key in self.redis_client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE):
+            pipe.unlink(key)
+            deleted += 1
+            if deleted % SCAN_BATCH_SIZE == 0:
+                pipe.execute()
+        pipe.execute()
+        return deleted
+
     def get_stats(self) -> Dict[str, Any]:
         """キャッシュ統計情報の取得"""
         if not self.redis_client:
@@ -201,6 +373,201 @@ class RedisCache:
         return (hits / total * 100) if total > 0 else 0.0
 
 
+class AsyncRedisCache(_RedisCodec):
+    """redis.asyncio を使う非同期 Redis キャッシュクラス
+
+    イベントループ上のリクエストハンドラから使う。Redis への往復中も
+    ループをブロックしないため、同時リクエスト数に応じてスループットが伸びる。
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        decode_responses: bool = False,
+    ):
+        """非同期 Redis キャッシュの初期化
+
+        接続は最初のコマンド実行時に張られるため、ここでは接続テストを行わない。
+        接続エラーは各メソッドでログに記録し、キャッシュミスとして扱う。
+        """
+        super().__init__()
+        try:
+            pool = aioredis.ConnectionPool(
+                **_pool_options(host, port, db, password, decode_responses)
+            )
+            self.redis_client = aioredis.Redis(connection_pool=pool)
+        except Exception as e:
+            logger.error(f"Failed to create async Redis client: {e}")
+            self.redis_client = None
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        expire: Optional[int] = None,
+        namespace: str = "default",
+    ) -> bool:
+        """キャッシュに値を設定"""
+        if not self.redis_client:
+            return False
+
+        try:
+            return await self._write(key, self._serialize(value), expire, namespace)
+        except Exception as e:
+            logger.error(f"Failed to set cache key {key}: {e}")
+            return False
+
+    async def set_raw(
+        self,
+        key: str,
+        raw: bytes,
+        expire: Optional[int] = None,
+        namespace: str = "default",
+    ) -> bool:
+        """JSON エンコード済みのバイト列をそのまま保存（get では通常どおり復元）"""
+        if not self.redis_client:
+            return False
+
+        try:
+            return await self._write(key, _JSON_TAG + raw, expire, namespace)
+        except Exception as e:
+            logger.error(f"Failed to set cache key {key}: {e}")
+            return False
+
+    async def _write(
+        self, key: str, payload: bytes, expire: Optional[int], namespace: str
+    ) -> bool:
+        """シリアライズ済みの値を書き込む"""
+        cache_key = self._generate_key(key, namespace)
+        if expire:
+            return bool(await self.redis_client.setex(cache_key, expire, payload))
+        return bool(await self.redis_client.set(cache_key, payload))
+
+    async def get(self, key: str, namespace: str = "default") -> Optional[Any]:
+        """キャッシュから値を取得"""
+        if not self.redis_client:
+            return None
+
+        try:
+            cache_key = self._generate_key(key, namespace)
+            value = await self.redis_client.get(cache_key)
+
+            if value is None:
+                return None
+
+            return self._deserialize(value)
+        except Exception as e:
+            logger.error(f"Failed to get cache key {key}: {e}")
+            return None
+
+    async def get_many(
+        self, keys: List[str], namespace: str = "default"
+    ) -> Dict[str, Any]:
+        """複数キーの値を1往復（MGET）で取得"""
+        if not self.redis_client or not keys:
+            return {}
+
+        try:
+            prefix = self._prefix(namespace)
+            cache_keys = [prefix + key for key in keys]
+            values = await self.redis_client.mget(cache_keys)
+            return {
+                key: self._deserialize(value)
+                for key, value in zip(keys, values)
+                if value is not None
+            }
+        except Exception as e:
+            logger.error(f"Failed to get {len(keys)} cache keys: {e}")
+            return {}
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        expire: Optional[int] = None,
+        namespace: str = "default",
+    ) -> bool:
+        """複数キーの値をパイプラインで1往復で設定"""
+        if not self.redis_client:
+            return False
+        if not mapping:
+            return True
+
+        try:
+            prefix = self._prefix(namespace)
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                cache_key = prefix + key
+                serialized_value = self._serialize(value)
+                if expire:
+                    pipe.setex(cache_key, expire, serialized_value)
+                else:
+                    pipe.set(cache_key, serialized_value)
+
+            return all(await pipe.execute())
+        except Exception as e:
+            logger.error(f"Failed to set {len(mapping)} cache keys: {e}")
+            return False
+
+    async def delete(self, key: str, namespace: str = "default") -> bool:
+        """キャッシュから値を削除"""
+        if not self.redis_client:
+            return False
+
+        try:
+            cache_key = self._generate_key(key, namespace)
+            result = await self.redis_client.delete(cache_key)
+            return bool(result)
+        except Exception as e:
+            logger.error(f"Failed to delete cache key {key}: {e}")
+            return False
+
+    async def exists(self, key: str, namespace: str = "default") -> bool:
+        """キャッシュキーの存在確認"""
+        if not self.redis_client:
+            return False
+
+        try:
+            cache_key = self._generate_key(key, namespace)
+            return bool(await self.redis_client.exists(cache_key))
+        except Exception as e:
+            logger.error(f"Failed to check cache key {key}: {e}")
+            return False
+
+    async def clear_namespace(self, namespace: str = "default") -> bool:
+        """名前空間内の全キーを削除"""
+        if not self.redis_client:
+            return False
+
+        try:
+            await self.unlink_matching(f"{namespace}:*")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to clear namespace {namespace}: {e}")
+            return False
+
+    async def unlink_matching(self, pattern: str) -> int:
+        """パターンに一致するキーを SCAN で走査し UNLINK で削除"""
+        deleted = 0
+        pipe = self.redis_client.pipeline(transaction=False)
+        async for key in self.redis_client.scan_iter(
+            match=pattern, count=SCAN_BATCH_SIZE
+        ):
+            pipe.unlink(key)
+            deleted += 1
+            if deleted % SCAN_BATCH_SIZE == 0:
+                await pipe.execute()
+        await pipe.execute()
+        return deleted
+
+    async def close(self) -> None:
+        """接続プールを閉じる（アプリケーション終了時に呼ぶ）"""
+        if self.redis_client:
+            await self.redis_client.aclose()
+
+
 # グローバルキャッシュインスタンス
 cache = RedisCache(
     host=os.getenv("REDIS_HOST", "localhost"),
@@ -208,23 +575,66 @@ cache = RedisCache(
     db=int(os.getenv("REDIS_DB", "0")),
     password=os.getenv("REDIS_PASSWORD"),
 )
+async_cache = AsyncRedisCache(
+    host=os.getenv("REDIS_HOST", "localhost"),
+    port=int(os.getenv("REDIS_PORT", "6379")),
+    db=int(os.getenv("REDIS_DB", "0")),
+    password=os.getenv("REDIS_PASSWORD"),
+)
+
+
+# 実行中の関数呼び出し（キャッシュミス時の重複実行を防ぐ）
+_inflight = SingleFlight()
+_async_inflight = AsyncSingleFlight()
+
+
+def _cache_key_hash(func, args, kwargs) -> str:
+    """関数名と引数からキャッシュキーを生成"""
+    key_data = {
+        "func": func.__name__,
+        "args": args,
+        "kwargs": kwargs,
+    }
+    # プロセス間で同じキーになるよう JSON で正規化し、BLAKE2 で短縮
+    return hashlib.blake2b(
+        json.dumps(key_data, sort_keys=True).encode(), digest_size=16
+    ).hexdigest()
 
 
 # デコレータ関数
 def cache_result(expire: int = 300, namespace: str = "api"):
-    """関数の結果をキャッシュするデコレータ"""
+    """関数の結果をキャッシュするデコレータ
+
+    コルーチン関数には非同期クライアントを使うラッパーを返す。
+    """
+
+    def _async_wrapper(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key_hash = _cache_key_hash(func, args, kwargs)
+
+            cached_result = await async_cache.get(key_hash, namespace)
+            if cached_result is not None:
+                logger.debug(f"Cache hit for {func.__name__}")
+                return cached_result
+
+            async def compute():
+                result = await func(*args, **kwargs)
+                await async_cache.set(key_hash, result, expire, namespace)
+                logger.debug(f"Cache miss for {func.__name__}, result cached")
+                return result
+
+            return await _async_inflight.do((namespace, key_hash), compute)
+
+        return wrapper
 
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            return _async_wrapper(func)
+
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # キャッシュキーの生成
-            key_data = {
-                "func": func.__name__,
-                "args": args,
-                "kwargs": kwargs,
-            }
-            key_hash = hashlib.md5(
-                json.dumps(key_data, sort_keys=True).encode()
-            ).hexdigest()
+            key_hash = _cache_key_hash(func, args, kwargs)
 
             # キャッシュから取得を試行
             cached_result = cache.get(key_hash, namespace)
@@ -232,12 +642,15 @@ def cache_result(expire: int = 300, namespace: str = "api"):
                 logger.debug(f"Cache hit for {func.__name__}")
                 return cached_result
 
-            # 関数を実行して結果をキャッシュ
-            result = func(*args, **kwargs)
-            cache.set(key_hash, result, expire, namespace)
-            logger.debug(f"Cache miss for {func.__name__}, result cached")
+            def compute():
+                # 関数を実行して結果をキャッシュ
+                result = func(*args, **kwargs)
+                cache.set(key_hash, result, expire, namespace)
+                logger.debug(f"Cache miss for {func.__name__}, result cached")
+                return result
 
-            return result
+            # 同じキーの計算が実行中なら、その結果を待つ
+            return _inflight.do((namespace, key_hash), compute)
 
         return wrapper
 
@@ -251,10 +664,7 @@ def invalidate_pattern(pattern: str, namespace: str = "api") -> bool:
         return False
 
     try:
-        full_pattern = f"{namespace}:{pattern}"
-        keys = cache.redis_client.keys(full_pattern)
-        if keys:
-            return bool(cache.redis_client.delete(*keys))
+        cache.unlink_matching(f"{namespace}:{pattern}")
         return True
     except Exception as e:
         logger.error(f"Failed to invalidate pattern {pattern}: {e}")
@@ -263,10 +673,4 @@ def invalidate_pattern(pattern: str, namespace: str = "api") -> bool:
 
 def warm_cache(data: Dict[str, Any], namespace: str = "api") -> bool:
     """キャッシュのウォームアップ"""
-    try:
-        for key, value in data.items():
-            cache.set(key, value, namespace=namespace)
-        return True
-    except Exception as e:
-        logger.error(f"Failed to warm cache: {e}")
-        return False
+    return cache.set_many(data, namespace=namespace)
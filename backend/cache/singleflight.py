@@ -0,0 +1,86 @@
+"""
+Single-flight Implementation
+同一キーの同時実行を1回にまとめるためのヘルパー
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """同一キーの同時呼び出しを1回の実行にまとめるクラス"""
+
+    def __init__(self):
+        """シングルフライトの初期化"""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """キーごとに fn を1回だけ実行し、実行中の呼び出しは結果を待つ"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            # 先行する呼び出しの結果（または例外）を共有する
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """SingleFlight のイベントループ版（同一ループ内のコルーチン間でまとめる）"""
+
+    def __init__(self):
+        """シングルフライトの初期化"""
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """キーごとに fn を1回だけ await し、実行中の呼び出しは結果を待つ
+
+        先行する呼び出しがキャンセルされた場合、待機側はキャンセル扱いにせず
+        やり直し、最初に再開したものが新たに fn を実行する。
+        """
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+            try:
+                # 待機側のキャンセルが先行する実行に波及しないよう shield する
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 待機側自身がキャンセルされた場合はそのまま伝える
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # 待機側には再実行させる（キーは finally で先に外れる）
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 待機者がいない場合の "exception was never retrieved" 警告を抑止
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
@@ -6,10 +6,10 @@ import logging
 import os
 from pathlib import Path
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import QueuePool, StaticPool
+from sqlalchemy.pool import NullPool, QueuePool, StaticPool
 
 logger = logging.getLogger(__name__)
 
@@ -22,18 +22,32 @@ DATABASE_URL = os.getenv("DATABASE_URL", DEFAULT_SQLITE_URL)
 is_sqlite = "sqlite" in DATABASE_URL
 is_postgresql = "postgresql" in DATABASE_URL
 
+# コンパイル済みSQLのキャッシュ件数（既定の500ではクエリの種類が多いと入れ替わりが起きる）
+QUERY_CACHE_SIZE = 1200
+# executemany の INSERT を1文にまとめる行数
+INSERTMANYVALUES_PAGE_SIZE = 1000
+
 # 接続プール設定
 if is_sqlite:
     # SQLite用の設定
+    # ファイルDBはリクエストごとに接続を開く（WALなら読み取りは並行できる）。
+    # インメモリDBは接続ごとに別DBになるため単一接続を共有する
+    is_memory = ":memory:" in DATABASE_URL or DATABASE_URL.endswith("sqlite://")
     engine = create_engine(
         DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-        pool_pre_ping=True,
+        connect_args={"check_same_thread": False, "timeout": 30},
+        poolclass=StaticPool if is_memory else NullPool,
+        query_cache_size=QUERY_CACHE_SIZE,
         echo=False,
     )
 elif is_postgresql:
     # PostgreSQL用の設定（本番環境）
+    # psycopg2 では UPDATE/DELETE の executemany も execute_batch でまとめる
+    driver_options = (
+        {"executemany_mode": "values_plus_batch"}
+        if make_url(DATABASE_URL).get_driver_name() == "psycopg2"
+        else {}
+    )
     engine = create_engine(
         DATABASE_URL,
         poolclass=QueuePool,
@@ -41,13 +55,17 @@ elif is_postgresql:
         max_overflow=30,  # 最大オーバーフロー接続数
         pool_pre_ping=True,  # 接続の生存確認
         pool_recycle=3600,  # 接続のリサイクル時間（1時間）
+        query_cache_size=QUERY_CACHE_SIZE,  # コンパイル済みSQLのキャッシュ
+        insertmanyvalues_page_size=INSERTMANYVALUES_PAGE_SIZE,  # 一括INSERTの行数
         echo=False,
+        **driver_options,
     )
 else:
     # その他のデータベース
     engine = create_engine(
         DATABASE_URL,
         pool_pre_ping=True,
+        query_cache_size=QUERY_CACHE_SIZE,
         echo=False,
     )
 
@@ -74,9 +92,21 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
         cursor.execute("PRAGMA cache_size=10000")  # キャッシュサイズの増加
         cursor.execute("PRAGMA temp_store=MEMORY")  # 一時テーブルをメモリに
         cursor.execute("PRAGMA mmap_size=268435456")  # メモリマップサイズ
+        cursor.execute("PRAGMA busy_timeout=30000")  # 書き込み競合時は30秒待つ
+        cursor.execute("PRAGMA wal_autocheckpoint=1000")  # WALのチェックポイント間隔
         cursor.close()
 
 
+@event.listens_for(engine, "close")
+def optimize_sqlite_on_close(dbapi_connection, connection_record):
+    """SQLite接続を閉じる前に、その接続で実行したクエリをもとに統計を更新"""
+    if is_sqlite:
+        try:
+            dbapi_connection.execute("PRAGMA optimize")
+        except Exception as e:
+            logger.debug(f"PRAGMA optimize skipped: {e}")
+
+
 @event.listens_for(engine, "checkout")
 def receive_checkout(dbapi_connection, connection_record, connection_proxy):
     """接続チェックアウト時のログ"""
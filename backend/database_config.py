@@ -5,7 +5,7 @@ Optimized for Phase 7-1: Database optimization
 
 import os
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import QueuePool
@@ -28,8 +28,14 @@ POOL_CONFIG = {
     ),  # Connection recycle time (1 hour)
     "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),  # Connection timeout
     "echo": os.getenv("DB_ECHO", "false").lower() == "true",  # SQL query logging
+    "query_cache_size": 1200,  # Compiled statement cache entries (default 500)
+    "insertmanyvalues_page_size": 1000,  # Rows per batched executemany INSERT
 }
 
+# psycopg2 also batches executemany UPDATE/DELETE via execute_batch()
+if make_url(DATABASE_URL).get_driver_name() == "psycopg2":
+    POOL_CONFIG["executemany_mode"] = "values_plus_batch"
+
 # Create optimized engine
 engine: Engine = create_engine(DATABASE_URL, **POOL_CONFIG)
 
@@ -91,32 +97,10 @@ QUERY_HINTS = {
 }
 
 
-def apply_optimization_settings():
-    """Apply database optimization settings"""
-    from sqlalchemy import text
-
-    with engine.connect() as conn:
-        # Apply work memory settings
-        conn.execute(text(f"SET work_mem = '{OPTIMIZATION_SETTINGS['work_mem']}'"))
-        conn.execute(
-            text(
-                f"SET maintenance_work_mem = '{OPTIMIZATION_SETTINGS['maintenance_work_mem']}'"
-            )
-        )
-        conn.execute(
-            text(f"SET shared_buffers = '{OPTIMIZATION_SETTINGS['shared_buffers']}'")
-        )
-        conn.execute(
-            text(
-                f"SET effective_cache_size = '{OPTIMIZATION_SETTINGS['effective_cache_size']}'"
-            )
-        )
-
-        # Apply query hints
-        for hint, value in QUERY_HINTS.items():
-            conn.execute(text(f"SET {hint} = {str(value).lower()}"))
-
-        conn.commit()
+# Settings a role may override; scripts/apply_role_settings.py persists them
+# with ALTER ROLE so every new session starts with them, without a per-call
+# SET. shared_buffers is server-wide and must be set in postgresql.conf instead.
+ROLE_SETTINGS = ("work_mem", "maintenance_work_mem", "effective_cache_size")
 
 
 def get_connection_info():
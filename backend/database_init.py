@@ -2,10 +2,15 @@
 Database initialization script for AICA-SyS
 """
 
+import csv
+import io
 import os
 import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, insert, literal, select, text
 from sqlalchemy.orm import sessionmaker
 
 from models.base import Base
@@ -14,10 +19,79 @@ from models.content import Article, Newsletter, Trend
 from models.subscription import Subscription
 from models.user import User
 
+# (index name, table, column)
+INDEXES = (
+    # User table indexes
+    ("idx_users_email", "users", "email"),
+    ("idx_users_subscription_status", "users", "subscription_status"),
+    ("idx_users_created_at", "users", "created_at"),
+    # Article table indexes
+    ("idx_articles_slug", "articles", "slug"),
+    ("idx_articles_published_at", "articles", "published_at"),
+    ("idx_articles_status", "articles", "status"),
+    ("idx_articles_category", "articles", "category"),
+    # Newsletter table indexes
+    ("idx_newsletters_slug", "newsletters", "slug"),
+    ("idx_newsletters_published_at", "newsletters", "published_at"),
+    ("idx_newsletters_status", "newsletters", "status"),
+    # Trend table indexes
+    ("idx_trends_published_at", "trends", "published_at"),
+    ("idx_trends_category", "trends", "category"),
+    ("idx_trends_status", "trends", "status"),
+    # Collection job indexes
+    ("idx_collection_jobs_status", "collection_jobs", "status"),
+    ("idx_collection_jobs_created_at", "collection_jobs", "created_at"),
+    # Analysis result indexes
+    ("idx_analysis_results_job_id", "analysis_results", "job_id"),
+    ("idx_analysis_results_created_at", "analysis_results", "created_at"),
+    # Subscription indexes
+    ("idx_subscriptions_user_id", "subscriptions", "user_id"),
+    ("idx_subscriptions_status", "subscriptions", "status"),
+    ("idx_subscriptions_created_at", "subscriptions", "created_at"),
+)
+
+INDEX_DDL = tuple(
+    f"CREATE INDEX IF NOT EXISTS {name} ON {table}({column})"
+    for name, table, column in INDEXES
+)
+
+# SQLite: every statement in one script, run as a single transaction
+INDEX_SCRIPT = "BEGIN;\n" + ";\n".join(INDEX_DDL) + ";\nCOMMIT;"
+
+# PostgreSQL: CONCURRENTLY builds grouped per table
+CONCURRENT_INDEX_DDL_BY_TABLE = {}
+for _name, _table, _column in INDEXES:
+    CONCURRENT_INDEX_DDL_BY_TABLE.setdefault(_table, []).append(
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {_name} ON {_table}({_column})"
+    )
+
+# Upper bound on parallel index builds on PostgreSQL (one table per worker)
+INDEX_BUILD_WORKERS = 8
+
+# Built once; each caller binds its own engine when opening a session
+SessionFactory = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False)
+
+# Development seed users, as plain tuples in USER_SEED_COLUMNS order
+USER_SEED_COLUMNS = ("email", "name", "subscription_status", "is_active")
+SAMPLE_USERS = (
+    ("admin@aica-sys.com", "Admin User", "premium", True),
+    ("user@example.com", "Test User", "free", True),
+)
+
 
 def create_database_tables(database_url: str):
     """Create all database tables"""
-    engine = create_engine(database_url)
+    engine_kwargs = {"pool_pre_ping": True}
+    if database_url.startswith("postgresql"):
+        engine_kwargs.update(
+            pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "40")),
+            pool_timeout=30,
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "3600")),
+            # Abort runaway statements after 30s
+            connect_args={"options": "-c statement_timeout=30000"},
+        )
+    engine = create_engine(database_url, **engine_kwargs)
 
     # Create all tables
     Base.metadata.create_all(bind=engine)
@@ -28,140 +102,106 @@ def create_database_tables(database_url: str):
 
 def create_database_indexes(engine):
     """Create database indexes for better performance"""
-    with engine.connect() as conn:
-        # User table indexes
-        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_users_email ON users(email)"))
-        conn.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS idx_users_subscription_status ON users(subscription_status)"
-            )
-        )
-        conn.execute(
-            text("CREATE INDEX IF NOT EXISTS idx_users_created_at ON users(created_at)")
-        )
-
-        # Article table indexes
-        conn.execute(
-            text("CREATE INDEX IF NOT EXISTS idx_articles_slug ON articles(slug)")
-        )
-        conn.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at)"
-            )
-        )
-        conn.execute(
-            text("CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(status)")
-        )
-        conn.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category)"
-            )
-        )
-
-        # Newsletter table indexes
-        conn.execute(
-            text("CREATE INDEX IF NOT EXISTS idx_newsletters_slug ON newsletters(slug)")
-        )
-        conn.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS idx_newsletters_published_at ON newsletters(published_at)"
-            )
-        )
-        conn.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS idx_newsletters_status ON newsletters(status)"
-            )
-        )
-
-        # Trend table indexes
-        conn.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS idx_trends_published_at ON trends(published_at)"
-            )
-        )
-        conn.execute(
-            text("CREATE INDEX IF NOT EXISTS idx_trends_category ON trends(category)")
-        )
-        conn.execute(
-            text("CREATE INDEX IF NOT EXISTS idx_trends_status ON trends(status)")
-        )
-
-        # Collection job indexes
-        conn.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS idx_collection_jobs_status ON collection_jobs(status)"
-            )
-        )
-        conn.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS idx_collection_jobs_created_at ON collection_jobs(created_at)"
-            )
-        )
-
-        # Analysis result indexes
-        conn.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS idx_analysis_results_job_id ON analysis_results(job_id)"
-            )
-        )
-        conn.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS idx_analysis_results_created_at ON analysis_results(created_at)"
-            )
-        )
-
-        # Subscription indexes
-        conn.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS idx_subscriptions_user_id ON subscriptions(user_id)"
-            )
-        )
-        conn.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS idx_subscriptions_status ON subscriptions(status)"
-            )
-        )
-        conn.execute(
-            text(
-                "CREATE INDEX IF NOT EXISTS idx_subscriptions_created_at ON subscriptions(created_at)"
-            )
-        )
-
-        conn.commit()
-        print("✅ Database indexes created successfully")
+    dialect = engine.dialect.name
+
+    if dialect == "postgresql":
+        # CONCURRENTLY cannot run inside a transaction, and only one concurrent
+        # build may run per table, so build each table's indexes in its own thread
+        autocommit_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+        def build(statements):
+            with autocommit_engine.connect() as conn:
+                # Index builds on large tables may legitimately exceed the
+                # engine-wide statement timeout
+                conn.exec_driver_sql("SET statement_timeout = 0")
+                try:
+                    for statement in statements:
+                        conn.exec_driver_sql(statement)
+                finally:
+                    # Back to the connect-time value before returning to the pool
+                    conn.exec_driver_sql("RESET statement_timeout")
+
+        groups = CONCURRENT_INDEX_DDL_BY_TABLE
+        workers = min(INDEX_BUILD_WORKERS, len(groups)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(build, statements): table
+                for table, statements in groups.items()
+            }
+            failures = []
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ Index build failed on {futures[future]}: {e}")
+                    failures.append(e)
+        if failures:
+            raise failures[0]
+    elif dialect == "sqlite":
+        # One script, one transaction: a single parse and a single fsync
+        with engine.connect() as conn:
+            conn.connection.executescript(INDEX_SCRIPT)
+    else:
+        with engine.begin() as conn:
+            for statement in INDEX_DDL:
+                conn.exec_driver_sql(statement)
+
+    print("✅ Database indexes created successfully")
+
+
+def _copy_rows(engine, table, columns, rows):
+    """Stream rows into a PostgreSQL table with COPY ... FROM STDIN"""
+    sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        if engine.dialect.driver == "psycopg":
+            with cursor.copy(sql) as copy:
+                for row in rows:
+                    copy.write_row(row)
+        else:
+            # psycopg2: COPY reads CSV from a file-like buffer
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(rows)
+            buffer.seek(0)
+            cursor.copy_expert(f"{sql} WITH (FORMAT csv)", buffer)
+        cursor.close()
+        raw.commit()
+    finally:
+        raw.close()
+
+
+def bulk_load_users(engine, rows):
+    """Load user rows (tuples in USER_SEED_COLUMNS order) in one transaction
+
+    PostgreSQL uses COPY; other databases get a single batched executemany.
+    COPY bypasses Python-side column defaults, so ids and timestamps are
+    filled in here for both paths.
+    """
+    now = datetime.utcnow()
+    columns = ("id", *USER_SEED_COLUMNS, "created_at", "updated_at")
+    full_rows = [(str(uuid.uuid4()), *row, now, now) for row in rows]
+
+    if engine.dialect.name == "postgresql":
+        _copy_rows(engine, User.__tablename__, columns, full_rows)
+    else:
+        with engine.begin() as conn:
+            conn.execute(insert(User), [dict(zip(columns, row)) for row in full_rows])
 
 
 def create_sample_data(engine):
     """Create sample data for development"""
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-    with SessionLocal() as session:
+    with SessionFactory(bind=engine) as session:
         # Check if data already exists
-        if session.query(User).first():
+        # Existence probe only: no User row is hydrated
+        exists = session.execute(select(literal(1)).select_from(User).limit(1)).scalar()
+        if exists is not None:
             print("ℹ️  Sample data already exists, skipping...")
             return
 
-        # Create sample users
-        sample_users = [
-            User(
-                email="admin@aica-sys.com",
-                name="Admin User",
-                subscription_status="premium",
-                is_active=True,
-            ),
-            User(
-                email="user@example.com",
-                name="Test User",
-                subscription_status="free",
-                is_active=True,
-            ),
-        ]
-
-        for user in sample_users:
-            session.add(user)
-
-        session.commit()
-        print("✅ Sample data created successfully")
+    # Create sample users
+    bulk_load_users(engine, SAMPLE_USERS)
+    print("✅ Sample data created successfully")
 
 
 def setup_database_optimizations(engine):
@@ -185,6 +225,13 @@ def setup_database_optimizations(engine):
         print("✅ PostgreSQL optimizations applied successfully")
 
 
+def analyze_database(engine):
+    """Collect planner statistics so first queries are planned on real data"""
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    print("✅ Database statistics updated")
+
+
 def main():
     """Main initialization function"""
     database_url = os.getenv("DATABASE_URL", "sqlite:///./aica_sys.db")
@@ -195,9 +242,6 @@ def main():
         # Create tables
         engine = create_database_tables(database_url)
 
-        # Create indexes
-        create_database_indexes(engine)
-
         # Setup optimizations
         setup_database_optimizations(engine)
 
@@ -205,6 +249,12 @@ def main():
         if os.getenv("ENVIRONMENT", "development") == "development":
             create_sample_data(engine)
 
+        # Create indexes once the data is loaded, not row by row during it
+        create_database_indexes(engine)
+
+        # Refresh planner statistics for the new tables, indexes and rows
+        analyze_database(engine)
+
         print("🎉 Database initialization completed successfully!")
 
     except Exception as e:
@@ -4,15 +4,20 @@ AI-driven Content Curation & Automated Sales System
 """
 
 import asyncio
+import importlib
 import logging
 import os
+import sys
+import time
 from contextlib import suppress
 
+import orjson
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.middleware import Middleware
 
 # Import audit middleware
 from middleware.audit_middleware import AuditMiddleware
@@ -23,6 +28,9 @@ from middleware.monitoring_middleware import MonitoringMiddleware
 # Import performance middleware
 from middleware.performance_middleware import performance_metrics
 
+# Import trusted host middleware
+from middleware.trusted_host import FastTrustedHostMiddleware
+
 # Import security middleware
 from security.security_headers import SecurityHeadersMiddleware
 
@@ -41,65 +49,120 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    # Outermost first. Security headers are applied by MonitoringMiddleware in
+    # the same pass rather than by a separate middleware layer.
+    middleware=[
+        Middleware(
+            FastTrustedHostMiddleware,
+            allowed_hosts=[
+                "localhost",
+                "127.0.0.1",
+                "*.vercel.app",
+                "*.supabase.co",
+                "*.onrender.com",
+            ],
+        ),
+        Middleware(
+            CORSMiddleware,
+            allow_origins=[
+                "http://localhost:3000",
+                "https://aica-sys.vercel.app",
+                "https://aica-sys-konishib0engineer-gmailcoms-projects.vercel.app",
+            ],
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        ),
+        Middleware(AuditMiddleware),
+        Middleware(
+            MonitoringMiddleware,
+            response_hooks=[SecurityHeadersMiddleware.as_response_hook()],
+        ),
+    ],
 )
 
-# Add monitoring middleware
-app.add_middleware(MonitoringMiddleware)
+# Static probe bodies, serialized once at import
+_ROOT_BODY = orjson.dumps(
+    {"message": "AICA-SyS API", "version": "0.1.0", "status": "running"}
+)
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "timestamp": "2024-01-01T00:00:00Z"})
+
+
+# Routers as (module, attribute) pairs, imported when the app starts rather
+# than when this module is imported
+ROUTERS = (
+    ("routers.content", "router"),
+    ("routers.collection", "router"),
+    ("routers.analysis", "router"),
+    ("routers.ai_router", "router"),
+    ("routers.auth_router", "router"),
+    ("routers.subscription_router", "router"),
+    ("routers.reports_router", "router"),
+    ("routers.user_router", "router"),
+    ("routers.content_management_router", "router"),
+    ("routers.monitoring_router", "router"),
+    ("routers.audit_router", "router"),
+    ("routers.optimized_content_router", "router"),
+    ("routers.content_quality_router", "router"),
+    ("routers.engagement_router", "router"),
+    ("routers.subscription_enhanced_router", "router"),
+    ("routers.affiliate_router", "router"),
+    ("routers.analytics_router", "router"),
+)
+_routers_included = False
 
-# Add audit middleware
-app.add_middleware(AuditMiddleware)
 
-# Add security headers middleware
-app.add_middleware(SecurityHeadersMiddleware)
+@app.on_event("startup")
+async def include_routers():
+    """Import and mount the API routers"""
+    global _routers_included
+    if _routers_included:
+        return
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "https://aica-sys.vercel.app",
-        "https://aica-sys-konishib0engineer-gmailcoms-projects.vercel.app",
-    ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Trusted host middleware
-app.add_middleware(
-    TrustedHostMiddleware,
-    allowed_hosts=[
-        "localhost",
-        "127.0.0.1",
-        "*.vercel.app",
-        "*.supabase.co",
-        "*.onrender.com",
-    ],
-)
+    for module_name, attr in ROUTERS:
+        module = importlib.import_module(module_name)
+        app.include_router(getattr(module, attr))
+    _routers_included = True
+    logger.info("Included %d routers", len(ROUTERS))
 
 
 @app.get("/")
 async def root():
     """Root endpoint"""
-    return {"message": "AICA-SyS API", "version": "0.1.0", "status": "running"}
+    return Response(_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": "2024-01-01T00:00:00Z"}
+    return Response(_HEALTH_BODY, media_type="application/json")
+
+
+# Scrapers poll every few seconds; one aggregation per second serves them all
+METRICS_CACHE_TTL = 1.0
+_metrics_cache = [0.0, None]  # [expires_at (monotonic), stats]
+
+
+def _cached_performance_stats():
+    """performance_metrics.get_stats() memoized for METRICS_CACHE_TTL seconds"""
+    now = time.monotonic()
+    if now >= _metrics_cache[0]:
+        # get_stats is synchronous, so no other request can interleave here
+        _metrics_cache[:] = [now + METRICS_CACHE_TTL, performance_metrics.get_stats()]
+    return _metrics_cache[1]
 
 
 @app.get("/metrics")
 async def get_metrics():
     """Performance metrics endpoint"""
-    return performance_metrics.get_stats()
+    return _cached_performance_stats()
 
 
 @app.get("/health/detailed")
 async def detailed_health_check():
     """Detailed health check with performance metrics"""
-    health_status = performance_metrics.get_stats()
+    health_status = _cached_performance_stats()
     return health_status
 
 
@@ -157,50 +220,17 @@ async def stop_background_content_sync():
     logger.info("Background content sync task stopped")
 
 
-# Import routers
-from routers import (
-    ai_router,
-    analysis_router,
-    audit_router,
-    auth_router,
-    collection_router,
-    content_management_router,
-    content_router,
-    monitoring_router,
-    reports_router,
-    subscription_router,
-    user_router,
-)
-from routers.affiliate_router import router as affiliate_router
-from routers.analytics_router import router as analytics_router
-from routers.content_quality_router import router as content_quality_router
-from routers.engagement_router import router as engagement_router
-from routers.optimized_content_router import router as optimized_content_router
-from routers.subscription_enhanced_router import router as subscription_enhanced_router
-
-# Include routers
-app.include_router(content_router)
-app.include_router(collection_router)
-app.include_router(analysis_router)
-app.include_router(ai_router.router)
-app.include_router(auth_router.router)
-app.include_router(subscription_router.router)
-app.include_router(reports_router.router)
-app.include_router(user_router.router)
-app.include_router(content_management_router.router)
-app.include_router(monitoring_router.router)
-app.include_router(audit_router.router)
-app.include_router(optimized_content_router)
-app.include_router(content_quality_router)
-app.include_router(engagement_router)
-app.include_router(subscription_enhanced_router)
-app.include_router(affiliate_router)
-app.include_router(analytics_router)
-
 if __name__ == "__main__":
+    reload = os.getenv("ENVIRONMENT") == "development"
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True if os.getenv("ENVIRONMENT") == "development" else False,
+        # uvloop and httptools ship with uvicorn[standard]; uvloop has no Windows build
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # Each worker runs its own content-sync task, so scale out explicitly.
+        # The reloader only supports a single process.
+        workers=1 if reload else int(os.getenv("WEB_CONCURRENCY", "1")),
+        reload=reload,
     )
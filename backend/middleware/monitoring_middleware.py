@@ -1,5 +1,5 @@
 import time
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Sequence
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -12,8 +12,14 @@ logger = get_logger(__name__)
 class MonitoringMiddleware(BaseHTTPMiddleware):
     """リクエスト/レスポンスの監視とメトリクス収集を行うミドルウェア"""
 
-    def __init__(self, app):
+    def __init__(
+        self,
+        app,
+        response_hooks: Sequence[Callable[[Request, Response], None]] = (),
+    ):
         super().__init__(app)
+        # レスポンスヘッダーの付与など、別レイヤーにせず同じパスで行う処理
+        self.response_hooks = tuple(response_hooks)
         self.request_count = 0
         self.error_count = 0
         self.response_times = []
@@ -28,6 +34,8 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         try:
             # リクエストを処理
             response = await call_next(request)
+            for hook in self.response_hooks:
+                hook(request, response)
 
             # レスポンス情報を収集
             response_time = time.time() - start_time
@@ -0,0 +1,47 @@
+"""
+Trusted Host Middleware
+許可ホストの判定を事前計算した集合とサフィックスで行う TrustedHostMiddleware
+"""
+
+from typing import Sequence
+
+from starlette.middleware.trustedhost import TrustedHostMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class FastTrustedHostMiddleware(TrustedHostMiddleware):
+    """許可ホストの判定をリクエストごとのリスト走査なしで行うミドルウェア
+
+    完全一致のホストは frozenset、ワイルドカード（*.example.com）は
+    サフィックスのタプルにまとめ、str.endswith の1回呼び出しで判定する。
+    判定結果は Starlette の実装と同じで、不許可の場合（www へのリダイレクトを
+    含む）は親クラスの処理にそのまま委ねる。
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allowed_hosts: Sequence[str] = None,
+        www_redirect: bool = True,
+    ) -> None:
+        super().__init__(app, allowed_hosts, www_redirect)
+        self._exact = frozenset(h for h in self.allowed_hosts if "*" not in h)
+        self._suffixes = tuple(h[1:] for h in self.allowed_hosts if h.startswith("*."))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.allow_any or scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        host = ""
+        for name, value in scope["headers"]:
+            if name == b"host":
+                host = value.decode("latin-1").split(":")[0]
+                break
+
+        if host in self._exact or host.endswith(self._suffixes):
+            await self.app(scope, receive, send)
+            return
+
+        # 不許可のホスト（www リダイレクトとエラー応答は親クラスで処理）
+        await super().__call__(scope, receive, send)
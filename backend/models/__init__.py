@@ -3,7 +3,7 @@ Models package for AICA-SyS
 """
 
 from models.audit import AuditEvent, AuditEventDB, AuditEventType
-from models.collection import AnalysisResult, CollectionJob
+from models.collection import AnalysisResult, CollectionCache, CollectionJob
 from models.content import Article, Newsletter, Trend
 from models.subscription import Subscription
 
@@ -18,6 +18,7 @@ __all__ = [
     "Subscription",
     "CollectionJob",
     "AnalysisResult",
+    "CollectionCache",
     "AuditEvent",
     "AuditEventDB",
     "AuditEventType",
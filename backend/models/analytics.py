@@ -8,9 +8,20 @@ from enum import Enum
 from typing import Optional
 
 from pydantic import BaseModel
-from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 
 from database import Base
+from models.types import BigIntegerId
 
 
 class ReportType(str, Enum):
@@ -135,17 +146,21 @@ class SocialPostLogDB(Base):
     """SNS投稿ログ"""
 
     __tablename__ = "social_post_logs"
+    __table_args__ = (
+        Index("ix_social_post_logs_platform_post_type", "platform", "post_type"),
+        Index("ix_social_post_logs_platform_posted_at", "platform", "posted_at"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    platform = Column(String(50), default="twitter", index=True)
-    post_type = Column(String(50), index=True)
+    id = Column(BigIntegerId, primary_key=True, index=True)
+    platform = Column(String(50), default="twitter")
+    post_type = Column(String(50))
     title = Column(String(300), nullable=True)
     summary = Column(Text, nullable=True)
     url = Column(String, nullable=True)
     hashtags = Column(JSON, nullable=True)
     message = Column(Text, nullable=True)
     tweet_id = Column(String(100), nullable=True, index=True)
-    status = Column(String(20), default="pending", index=True)
+    status = Column(String(20), default="pending")
     error_message = Column(Text, nullable=True)
     tweet_text = Column(Text, nullable=True)
     tweet_metrics = Column(JSON, nullable=True)
@@ -155,7 +170,6 @@ class SocialPostLogDB(Base):
     posted_at = Column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
-        index=True,
     )
     metrics_updated_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(
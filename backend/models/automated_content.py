@@ -11,6 +11,7 @@ from pydantic import BaseModel
 from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Integer, String, Text
 
 from database import Base
+from models.types import BigIntegerId, OrjsonJSON
 
 
 class ContentType(str, Enum):
@@ -80,13 +81,14 @@ class SourceDataDB(Base):
 
     __tablename__ = "source_data"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntegerId, primary_key=True, index=True)
     source_type = Column(String, index=True)
     source_url = Column(String)
     title = Column(String(500))
     content = Column(Text, nullable=True)
     score = Column(Float, nullable=True)
-    source_metadata = Column(JSON)  # 'metadata'は予約語のため'source_metadata'に変更
+    # 'metadata'は予約語のため'source_metadata'に変更
+    source_metadata = Column(OrjsonJSON)
     collected_at = Column(DateTime, default=datetime.utcnow, index=True)
 
 
@@ -95,7 +97,7 @@ class ContentGenerationLogDB(Base):
 
     __tablename__ = "content_generation_logs"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigIntegerId, primary_key=True, index=True)
     content_id = Column(Integer, nullable=True)
     generation_type = Column(String)
     status = Column(String)  # success, failed, skipped
@@ -71,3 +71,20 @@ class AnalysisResult(Base):
 
     def __repr__(self) -> str:
         return f"<AnalysisResult(id={self.id}, title={self.title[:50]}...)>"
+
+
+class CollectionCache(Base):
+    """HTTP cache validators for collected URLs (conditional GET support)"""
+
+    __tablename__ = "collection_cache"
+
+    url: Mapped[str] = mapped_column(String(2048), primary_key=True)
+    etag: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
+    last_modified: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    def __repr__(self) -> str:
+        return f"<CollectionCache(url={self.url}, etag={self.etag})>"
@@ -0,0 +1,40 @@
+"""
+Custom column types for AICA-SyS
+"""
+
+import orjson
+from sqlalchemy import JSON, BigInteger, Integer
+from sqlalchemy.types import TypeDecorator
+
+# 64-bit surrogate key for append-heavy log tables. SQLite only
+# autoincrements an INTEGER PRIMARY KEY, so it keeps the 32-bit type there.
+BigIntegerId = BigInteger().with_variant(Integer(), "sqlite")
+
+
+class OrjsonJSON(TypeDecorator):
+    """JSON column serialized with orjson
+
+    Storage is the dialect's regular JSON type, so no migration is needed;
+    only the Python-side encoding and decoding change. Raw collection
+    payloads are written in bulk, where stdlib json dominates insert time.
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        def process(value):
+            if value is None:
+                return None
+            return orjson.dumps(value).decode()
+
+        return process
+
+    def result_processor(self, dialect, coltype):
+        def process(value):
+            # Some drivers (psycopg2) already return decoded objects
+            if isinstance(value, (str, bytes)):
+                return orjson.loads(value)
+            return value
+
+        return process
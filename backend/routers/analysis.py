@@ -10,7 +10,7 @@ from sqlalchemy.orm import Session
 from agents.analysis_agent import AnalysisAgent
 from database import get_db
 from models.collection import AnalysisResult
-from utils.ai_client import AIClient
+from utils.ai_client import AIClient, BatchingAIClient
 
 router = APIRouter(prefix="/api/analysis", tags=["analysis"])
 
@@ -53,14 +53,17 @@ async def get_analysis_result(result_id: str, db: Session = Depends(get_db)):
 async def start_analysis(db: Session = Depends(get_db)):
     """Start analysis process"""
     try:
-        # Initialize AI client
-        ai_client = AIClient()
+        # Initialize AI client (analysis requests are micro-batched)
+        ai_client = BatchingAIClient(AIClient())
 
         # Initialize analysis agent
         analysis_agent = AnalysisAgent(db, ai_client)
 
         # Start analysis
-        results = await analysis_agent.analyze_collected_data()
+        try:
+            results = await analysis_agent.analyze_collected_data()
+        finally:
+            await ai_client.aclose()
 
         return {"message": "Analysis started successfully", "results": results}
 
@@ -10,7 +10,7 @@ from sqlalchemy.orm import Session
 from agents.collection_agent import CollectionAgent
 from database import get_db
 from models.collection import AnalysisResult, CollectionJob
-from utils.ai_client import AIClient
+from utils.ai_client import AIClient, BatchingAIClient
 
 router = APIRouter(prefix="/api/collection", tags=["collection"])
 
@@ -98,8 +98,8 @@ async def get_analysis_result(result_id: str, db: Session = Depends(get_db)):
 async def start_analysis(db: Session = Depends(get_db)):
     """Start analysis process"""
     try:
-        # Initialize AI client
-        ai_client = AIClient()
+        # Initialize AI client (analysis requests are micro-batched)
+        ai_client = BatchingAIClient(AIClient())
 
         # Initialize analysis agent
         from agents.analysis_agent import AnalysisAgent
@@ -107,7 +107,10 @@ async def start_analysis(db: Session = Depends(get_db)):
         analysis_agent = AnalysisAgent(db, ai_client)
 
         # Start analysis
-        results = await analysis_agent.analyze_collected_data()
+        try:
+            results = await analysis_agent.analyze_collected_data()
+        finally:
+            await ai_client.aclose()
 
         return {"message": "Analysis started successfully", "results": results}
 
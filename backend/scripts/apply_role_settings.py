@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+One-time setup: persist database tuning settings as role defaults.
+
+ALTER ROLE changes the defaults for every new session of the application
+role, so this runs once per database (or after changing the values in
+database_config.OPTIMIZATION_SETTINGS), never from the application itself.
+
+Usage:
+  ./venv/bin/python scripts/apply_role_settings.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.resolve()))
+
+from sqlalchemy import text
+
+from database_config import OPTIMIZATION_SETTINGS, ROLE_SETTINGS, engine
+
+
+def main() -> None:
+    if engine.dialect.name != "postgresql":
+        print("ℹ️  Skipping role settings (not using PostgreSQL)")
+        return
+
+    with engine.begin() as conn:
+        for name in ROLE_SETTINGS:
+            conn.execute(
+                text(
+                    f"ALTER ROLE CURRENT_USER SET {name} = "
+                    f"'{OPTIMIZATION_SETTINGS[name]}'"
+                )
+            )
+            print(f"✅ {name} = {OPTIMIZATION_SETTINGS[name]}")
+
+    # Sessions opened before the change keep their old values until reconnect
+    print("ℹ️  Restart the application to pick up the new defaults")
+
+
+if __name__ == "__main__":
+    main()
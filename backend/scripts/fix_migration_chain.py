@@ -12,12 +12,13 @@ from database import engine
 
 try:
     with engine.begin() as conn:
-        inspector = inspect(engine)
-        existing_tables = inspector.get_table_names()
+        # Probe only the tables that decide the revision, on the same
+        # connection, instead of listing every table in the schema
+        inspector = inspect(conn)
 
         # Check which tables from migrations exist
         has_4741_tables = all(
-            table in existing_tables
+            inspector.has_table(table)
             for table in [
                 "source_data",
                 "trend_data",
@@ -25,7 +26,7 @@ try:
                 "content_generation_logs",
             ]
         )
-        has_1cf2_table = "social_post_logs" in existing_tables
+        has_1cf2_table = inspector.has_table("social_post_logs")
 
         # Determine the appropriate revision to stamp
         if has_4741_tables and has_1cf2_table:
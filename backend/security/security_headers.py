@@ -57,18 +57,29 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             "block-all-mixed-content"
         )
 
+    @classmethod
+    def as_response_hook(cls, config: Optional[Dict[str, any]] = None):
+        """Return the header logic as a (request, response) callable
+
+        Lets another middleware apply the headers in its own pass instead of
+        wrapping the app in one more middleware layer.
+        """
+        return cls(None, config).apply
+
     async def dispatch(self, request: Request, call_next):
         """Process request and add security headers"""
         response = await call_next(request)
+        self.apply(request, response)
+        return response
 
+    def apply(self, request: Request, response: Response):
+        """Add security and request-specific headers to a response"""
         # Add security headers
         self._add_security_headers(response)
 
         # Add custom headers based on request
         self._add_custom_headers(request, response)
 
-        return response
-
     def _add_security_headers(self, response: Response):
         """Add security headers to response"""
         headers_to_add = {
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -12,6 +14,15 @@ except TypeError:
     )
 
 
+@pytest.fixture(scope="module", autouse=True)
+def app_lifespan():
+    """起動処理（ルーター登録）と終了処理をモジュール単位で実行する"""
+    # バックグラウンドのコンテンツ同期はマイグレーション済みのDBが必要なため無効にする
+    os.environ.setdefault("ENABLE_CONTENT_SYNC", "false")
+    with client:
+        yield
+
+
 def test_health_check():
     """ヘルスチェックエンドポイントのテスト"""
     response = client.get("/health")
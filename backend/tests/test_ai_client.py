@@ -0,0 +1,28 @@
+import asyncio
+
+from utils.ai_client import BatchingAIClient
+
+
+class _SlowInner:
+    """Inner client whose batch call never finishes on its own"""
+
+    async def analyze_batch(self, requests):
+        await asyncio.sleep(10)
+
+
+class TestBatchingAIClient:
+    def test_aclose_fails_in_flight_and_queued_requests(self):
+        """Closing fails requests already sent to analyze_batch and queued ones"""
+
+        async def main():
+            client = BatchingAIClient(_SlowInner(), max_batch_size=2, max_wait=0.01)
+            tasks = [asyncio.create_task(client.analyze_content(i)) for i in range(3)]
+            await asyncio.sleep(0.1)
+            await client.aclose()
+            return await asyncio.wait_for(
+                asyncio.gather(*tasks, return_exceptions=True), 1
+            )
+
+        results = asyncio.run(main())
+        assert len(results) == 3
+        assert all(isinstance(r, RuntimeError) for r in results)
@@ -1,3 +1,5 @@
+import os
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -12,6 +14,15 @@ except TypeError:
     )
 
 
+@pytest.fixture(scope="module", autouse=True)
+def app_lifespan():
+    """Run startup (router mounting) and shutdown once per module"""
+    # The background content sync needs a migrated database; keep it off here
+    os.environ.setdefault("ENABLE_CONTENT_SYNC", "false")
+    with client:
+        yield
+
+
 class TestHealthEndpoint:
     def test_health_check(self):
         """Test health check endpoint returns 200"""
@@ -0,0 +1,35 @@
+from cache.memory_cache import MemoryCache
+
+
+class TestMemoryCacheCapacity:
+    def test_shard_capacity_sums_to_max_size(self):
+        """Shard capacities add up exactly to max_size"""
+        for max_size in (1, 3, 10, 17, 1000):
+            cache = MemoryCache(max_size=max_size, cleanup_interval=None)
+            assert sum(shard.max_size for shard in cache._shards) == max_size
+            assert all(shard.max_size >= 1 for shard in cache._shards)
+
+    def test_size_never_exceeds_max_size(self):
+        """Filling the cache evicts instead of growing past max_size"""
+        cache = MemoryCache(max_size=10, cleanup_interval=None)
+
+        for i in range(200):
+            cache.set(f"key-{i}", i)
+            assert len(cache.get_keys()) <= 10
+
+        stats = cache.get_stats()
+        assert stats["size"] <= 10
+        assert stats["evictions"] == stats["sets"] - stats["size"]
+
+    def test_eviction_keeps_recently_read_entries(self):
+        """An entry that keeps being read survives eviction in its shard"""
+        cache = MemoryCache(max_size=4, shards=1, cleanup_interval=None)
+        cache.set("hot", "value")
+
+        for i in range(20):
+            assert cache.get("hot") == "value"
+            cache.set(f"cold-{i}", i)
+
+        assert cache.exists("hot")
+        assert cache.get_stats()["size"] == 4
+        assert cache.get("cold-0") is None
@@ -0,0 +1,65 @@
+from pydantic import BaseModel
+
+from cache.redis_cache import _RedisCodec, cache_result
+
+
+class Item(BaseModel):
+    name: str
+    tags: list[str] = []
+
+
+class Outer:
+    class Inner(BaseModel):
+        value: int
+
+
+class TestRedisCodec:
+    def test_pydantic_model_round_trips_as_model(self):
+        """Models are stored as JSON and decoded back to the same class"""
+        codec = _RedisCodec()
+        item = Item(name="ts", tags=["a", "b"])
+
+        data = codec._serialize(item)
+        restored = codec._deserialize(data)
+
+        assert data.startswith(b"M")
+        assert isinstance(restored, Item)
+        assert restored == item
+
+    def test_nested_model_class_is_resolved(self):
+        """Classes nested in another class are found by their qualified name"""
+        codec = _RedisCodec()
+        inner = Outer.Inner(value=1)
+
+        restored = codec._deserialize(codec._serialize(inner))
+
+        assert isinstance(restored, Outer.Inner)
+        assert restored == inner
+
+    def test_plain_values_use_json(self):
+        """JSON-compatible values still use the JSON tag"""
+        codec = _RedisCodec()
+
+        data = codec._serialize({"a": [1, 2]})
+
+        assert data.startswith(b"J")
+        assert codec._deserialize(data) == {"a": [1, 2]}
+
+
+class TestCacheResult:
+    def test_wrappers_keep_function_metadata(self):
+        """Sync and async wrappers expose the decorated function's metadata"""
+
+        @cache_result()
+        def sync_func():
+            """Sync docstring"""
+
+        @cache_result()
+        async def async_func():
+            """Async docstring"""
+
+        assert sync_func.__name__ == "sync_func"
+        assert sync_func.__doc__ == "Sync docstring"
+        assert sync_func.__wrapped__ is not None
+        assert async_func.__name__ == "async_func"
+        assert async_func.__doc__ == "Async docstring"
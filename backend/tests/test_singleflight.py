@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from cache.singleflight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight:
+    def _run_concurrently(self, flight, fn, count=5):
+        """Call flight.do from several threads and collect results/errors"""
+        results, errors = [], []
+
+        def call():
+            try:
+                results.append(flight.do("key", fn))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_concurrent_calls_run_once(self):
+        """Concurrent calls with the same key share one execution"""
+        flight = SingleFlight()
+        calls = []
+
+        def fn():
+            calls.append(1)
+            time.sleep(0.1)
+            return "value"
+
+        results, errors = self._run_concurrently(flight, fn)
+
+        assert errors == []
+        assert results == ["value"] * 5
+        assert len(calls) == 1
+        assert flight._calls == {}
+
+    def test_exception_is_shared(self):
+        """Waiters receive the leader's exception"""
+        flight = SingleFlight()
+
+        def fn():
+            time.sleep(0.1)
+            raise ValueError("boom")
+
+        results, errors = self._run_concurrently(flight, fn)
+
+        assert results == []
+        assert len(errors) == 5
+        assert all(isinstance(e, ValueError) for e in errors)
+        assert flight._calls == {}
+
+
+class TestAsyncSingleFlight:
+    def test_concurrent_calls_run_once(self):
+        """Concurrent coroutines with the same key share one execution"""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "value"
+
+        async def main():
+            return await asyncio.gather(*(flight.do("key", fn) for _ in range(5)))
+
+        assert asyncio.run(main()) == ["value"] * 5
+        assert len(calls) == 1
+        assert flight._calls == {}
+
+    def test_exception_is_shared(self):
+        """Waiters receive the leader's exception"""
+        flight = AsyncSingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.05)
+            raise ValueError("boom")
+
+        async def main():
+            return await asyncio.gather(
+                *(flight.do("key", fn) for _ in range(3)), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight._calls == {}
+
+    def test_leader_cancellation_lets_waiters_retry(self):
+        """Cancelling the leader does not cancel waiters; one of them re-runs fn"""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def fn():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "value"
+
+        async def main():
+            leader = asyncio.create_task(flight.do("key", fn))
+            await asyncio.sleep(0)
+            waiters = [asyncio.create_task(flight.do("key", fn)) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await asyncio.gather(*waiters)
+
+        assert asyncio.run(main()) == ["value"] * 3
+        assert len(calls) == 2
+        assert flight._calls == {}
+
+    def test_waiter_cancellation_does_not_affect_leader(self):
+        """Cancelling a waiter leaves the leader and other waiters running"""
+        flight = AsyncSingleFlight()
+
+        async def fn():
+            await asyncio.sleep(0.05)
+            return "value"
+
+        async def main():
+            leader = asyncio.create_task(flight.do("key", fn))
+            await asyncio.sleep(0)
+            waiter = asyncio.create_task(flight.do("key", fn))
+            other = asyncio.create_task(flight.do("key", fn))
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            return await leader, await other
+
+        assert asyncio.run(main()) == ("value", "value")
+        assert flight._calls == {}
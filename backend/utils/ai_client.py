@@ -14,6 +14,10 @@ from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Micro-batching defaults for BatchingAIClient
+ANALYSIS_BATCH_MAX_SIZE = 32
+ANALYSIS_BATCH_MAX_WAIT = 0.02  # seconds
+
 
 class AnalysisRequest(BaseModel):
     """Request model for AI analysis"""
@@ -100,6 +104,26 @@ class AIClient:
                 impact="low",
             )
 
+    async def analyze_batch(
+        self, requests: List[AnalysisRequest]
+    ) -> List[AnalysisResponse]:
+        """Analyze several pieces of content, using one AI call where possible"""
+        if len(requests) > 1 and self.groq_client:
+            try:
+                responses = await self._analyze_batch_with_groq(requests)
+                if len(responses) == len(requests):
+                    return responses
+                logger.warning(
+                    f"Batch analysis returned {len(responses)} results "
+                    f"for {len(requests)} requests, falling back to single calls"
+                )
+            except Exception as e:
+                logger.error(
+                    f"Batch analysis failed, falling back to single calls: {e}"
+                )
+
+        return list(await asyncio.gather(*(self.analyze_content(r) for r in requests)))
+
     async def generate_content(
         self, request: ContentGenerationRequest
     ) -> ContentGenerationResponse:
@@ -176,6 +200,61 @@ class AIClient:
             # Fallback parsing if JSON is malformed
             return self._parse_text_response(response_text)
 
+    async def _analyze_batch_with_groq(
+        self, requests: List[AnalysisRequest]
+    ) -> List[AnalysisResponse]:
+        """Analyze multiple contents in a single Groq call"""
+        items = "\n\n".join(
+            f"Item {i}: ({request.content_type}) {request.content}"
+            for i, request in enumerate(requests, 1)
+        )
+        prompt = f"""
+        Analyze each of the following {len(requests)} items for TypeScript ecosystem relevance:
+
+        {items}
+
+        For every item provide:
+        1. A concise summary (2-3 sentences)
+        2. Key points (3-5 bullet points)
+        3. Sentiment (positive/neutral/negative)
+        4. Relevance score (0.0 to 1.0) for TypeScript developers
+        5. Category (framework/library/tool/language/ecosystem)
+        6. Impact level (low/medium/high/critical)
+
+        Format your response as JSON with exactly one result per item, in the same order:
+        {{
+            "results": [
+                {{
+                    "summary": "...",
+                    "key_points": ["...", "..."],
+                    "sentiment": "...",
+                    "relevance_score": 0.0,
+                    "category": "...",
+                    "impact": "..."
+                }}
+            ]
+        }}
+        """
+
+        def _call_groq():
+            response = self.groq_client.chat.completions.create(
+                model="llama-3.3-70b-versatile",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert TypeScript developer analyzing content for relevance to the TypeScript ecosystem. Always respond with valid JSON.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.3,
+                max_tokens=min(1024 * len(requests), 32768),
+            )
+            return response.choices[0].message.content
+
+        response_text = await asyncio.to_thread(_call_groq)
+        result = json.loads(response_text)
+        return [AnalysisResponse(**item) for item in result["results"]]
+
     async def _generate_with_groq(
         self, request: ContentGenerationRequest
     ) -> ContentGenerationResponse:
@@ -319,3 +398,102 @@ Always respond with valid JSON format only."""
             tags=["typescript", "development"],
             estimated_read_time=max(1, len(text.split()) // 200),
         )
+
+
+class BatchingAIClient:
+    """AIClient wrapper that coalesces concurrent analysis requests into batches
+
+    Requests are queued and a background task groups up to ``max_batch_size``
+    of them, waiting at most ``max_wait`` seconds for a batch to fill, before
+    sending them through ``AIClient.analyze_batch``. Generation requests are
+    passed straight through.
+    """
+
+    def __init__(
+        self,
+        inner: AIClient,
+        max_batch_size: int = ANALYSIS_BATCH_MAX_SIZE,
+        max_wait: float = ANALYSIS_BATCH_MAX_WAIT,
+    ):
+        self.inner = inner
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher_task: Optional[asyncio.Task] = None
+
+    async def analyze_content(self, request: AnalysisRequest) -> AnalysisResponse:
+        """Queue a request for batched analysis and wait for its result"""
+        if self._batcher_task is None or self._batcher_task.done():
+            self._queue = asyncio.Queue()
+            self._batcher_task = asyncio.create_task(self._run_batcher())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((request, future))
+        return await future
+
+    async def generate_content(
+        self, request: ContentGenerationRequest
+    ) -> ContentGenerationResponse:
+        """Generate content using the wrapped client"""
+        return await self.inner.generate_content(request)
+
+    async def aclose(self) -> None:
+        """Stop the batcher task and fail any requests still queued"""
+        if self._batcher_task is None:
+            return
+
+        self._batcher_task.cancel()
+        try:
+            await self._batcher_task
+        except asyncio.CancelledError:
+            pass
+        self._batcher_task = None
+
+        pending = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        self._fail_unresolved(pending)
+
+    @staticmethod
+    def _fail_unresolved(items) -> None:
+        """Fail the futures of (request, future) pairs that have no result yet"""
+        for _, future in items:
+            if not future.done():
+                future.set_exception(RuntimeError("BatchingAIClient closed"))
+
+    async def _run_batcher(self) -> None:
+        """Collect queued requests into batches and dispatch them"""
+        loop = asyncio.get_running_loop()
+        # Requests taken off the queue whose futures may still be unresolved
+        batch = []
+
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.max_wait
+
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                try:
+                    responses = await self.inner.analyze_batch(
+                        [req for req, _ in batch]
+                    )
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for (_, future), response in zip(batch, responses):
+                    if not future.done():
+                        future.set_result(response)
+        finally:
+            # Cancelled by aclose() while collecting or awaiting analyze_batch
+            self._fail_unresolved(batch)
@@ -0,0 +1,52 @@
+"""
+Async concurrency helpers for AICA-SyS
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Iterable, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def bounded_map(
+    coro_fn: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    concurrency: int,
+    return_exceptions: bool = False,
+) -> List[R]:
+    """Await ``coro_fn(item)`` for every item with at most ``concurrency`` in flight
+
+    A new call is started only when an earlier one finishes, so socket and
+    memory usage stay bounded however long ``items`` is. Results are
+    returned in input order. With ``return_exceptions`` failures are returned
+    in place of results, as with ``asyncio.gather``; otherwise the first
+    failure cancels the remaining calls and is raised.
+    """
+    results: Dict[int, R] = {}
+    pending: Dict[asyncio.Future, int] = {}
+
+    async def drain(return_when: str) -> None:
+        done, _ = await asyncio.wait(pending, return_when=return_when)
+        for task in done:
+            index = pending.pop(task)
+            try:
+                results[index] = task.result()
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results[index] = e
+
+    try:
+        for index, item in enumerate(items):
+            pending[asyncio.ensure_future(coro_fn(item))] = index
+            if len(pending) >= concurrency:
+                await drain(asyncio.FIRST_COMPLETED)
+
+        while pending:
+            await drain(asyncio.FIRST_COMPLETED)
+    finally:
+        for task in pending:
+            task.cancel()
+
+    return [results[index] for index in range(len(results))]
@@ -2,10 +2,10 @@ import logging
 import os
 from contextlib import contextmanager
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, make_url
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import scoped_session, sessionmaker
-from sqlalchemy.pool import QueuePool, StaticPool
+from sqlalchemy.pool import NullPool, QueuePool, StaticPool
 
 logger = logging.getLogger(__name__)
 
@@ -24,19 +24,24 @@ class DatabaseManager:
         engine_kwargs = {
             "echo": os.getenv("DATABASE_ECHO", "false").lower() == "true",
             "future": True,
+            # Compiled statement cache (default 500 churns with many distinct queries)
+            "query_cache_size": 1200,
         }
 
         # Configure connection pool based on database type
         if self.database_url.startswith("sqlite"):
-            # SQLite configuration
+            # SQLite configuration: a connection per checkout so WAL readers run
+            # concurrently. An in-memory database only exists on one connection.
+            in_memory = ":memory:" in self.database_url or self.database_url.endswith(
+                "sqlite://"
+            )
             engine_kwargs.update(
                 {
-                    "poolclass": StaticPool,
+                    "poolclass": StaticPool if in_memory else NullPool,
                     "connect_args": {
                         "check_same_thread": False,
-                        "timeout": 20,
+                        "timeout": 30,
                     },
-                    "pool_pre_ping": True,
                 }
             )
         else:
@@ -49,8 +54,12 @@ class DatabaseManager:
                     "pool_pre_ping": True,
                     "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "3600")),
                     "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+                    "insertmanyvalues_page_size": 1000,
                 }
             )
+            # psycopg2 also batches executemany UPDATE/DELETE via execute_batch()
+            if make_url(self.database_url).get_driver_name() == "psycopg2":
+                engine_kwargs["executemany_mode"] = "values_plus_batch"
 
         self.engine = create_engine(self.database_url, **engine_kwargs)
 
@@ -85,8 +94,21 @@ class DatabaseManager:
                 cursor.execute("PRAGMA temp_store=MEMORY")
                 # Set mmap size to 256MB
                 cursor.execute("PRAGMA mmap_size=268435456")
+                # Wait for a concurrent writer instead of failing with "locked"
+                cursor.execute("PRAGMA busy_timeout=30000")
+                # Checkpoint the WAL every 1000 pages
+                cursor.execute("PRAGMA wal_autocheckpoint=1000")
                 cursor.close()
 
+        @event.listens_for(self.engine, "close")
+        def optimize_sqlite_on_close(dbapi_connection, connection_record):
+            """Let SQLite refresh planner statistics gathered on this connection"""
+            if self.database_url.startswith("sqlite"):
+                try:
+                    dbapi_connection.execute("PRAGMA optimize")
+                except Exception as e:
+                    logger.debug(f"PRAGMA optimize skipped: {e}")
+
         @event.listens_for(Engine, "before_cursor_execute")
         def receive_before_cursor_execute(
             conn, cursor, statement, parameters, context, executemany
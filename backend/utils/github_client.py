@@ -29,17 +29,26 @@ class GitHubClient:
         if self.session:
             await self.session.close()
 
-    async def get_recent_commits(self, repo_name: str, days: int = 7) -> List[Dict]:
-        """Get recent commits from a repository"""
+    async def get_recent_commits(
+        self, repo_name: str, days: int = 7, since: Optional[datetime] = None
+    ) -> List[Dict]:
+        """Get recent commits from a repository
+
+        ``since`` (e.g. the start of the last successful collection) narrows
+        the query to new activity; otherwise the last ``days`` are fetched.
+        Errors are re-raised rather than returned as an empty list, so a
+        failed fetch is never recorded as a successful run that moves
+        ``since`` past the activity it missed.
+        """
         if not self.github:
             return []
 
-        try:
+        def _fetch_commits() -> List[Dict]:
             repo = self.github.get_repo(repo_name)
-            since = datetime.utcnow() - timedelta(days=days)
+            cutoff = since or datetime.utcnow() - timedelta(days=days)
 
             commits = []
-            for commit in repo.get_commits(since=since):
+            for commit in repo.get_commits(since=cutoff):
                 commits.append(
                     {
                         "sha": commit.sha,
@@ -49,24 +58,32 @@ class GitHubClient:
                         "url": commit.html_url,
                     }
                 )
+                if len(commits) >= 50:  # Limit to 50 commits
+                    break
 
-            return commits[:50]  # Limit to 50 commits
+            return commits
+
+        try:
+            # PyGithub is synchronous, so run it off the event loop
+            return await asyncio.to_thread(_fetch_commits)
 
         except Exception as e:
             logger.error(f"Failed to get commits for {repo_name}: {e}")
-            return []
+            raise
 
-    async def get_recent_issues(self, repo_name: str, days: int = 7) -> List[Dict]:
-        """Get recent issues from a repository"""
+    async def get_recent_issues(
+        self, repo_name: str, days: int = 7, since: Optional[datetime] = None
+    ) -> List[Dict]:
+        """Get recent issues from a repository, newer than ``since`` if given"""
         if not self.github:
             return []
 
-        try:
+        def _fetch_issues() -> List[Dict]:
             repo = self.github.get_repo(repo_name)
-            since = datetime.utcnow() - timedelta(days=days)
+            cutoff = since or datetime.utcnow() - timedelta(days=days)
 
             issues = []
-            for issue in repo.get_issues(since=since, state="all"):
+            for issue in repo.get_issues(since=cutoff, state="all"):
                 issues.append(
                     {
                         "number": issue.number,
@@ -79,25 +96,32 @@ class GitHubClient:
                         "url": issue.html_url,
                     }
                 )
+                if len(issues) >= 30:  # Limit to 30 issues
+                    break
 
-            return issues[:30]  # Limit to 30 issues
+            return issues
+
+        try:
+            return await asyncio.to_thread(_fetch_issues)
 
         except Exception as e:
             logger.error(f"Failed to get issues for {repo_name}: {e}")
-            return []
+            raise
 
-    async def get_recent_releases(self, repo_name: str, days: int = 30) -> List[Dict]:
-        """Get recent releases from a repository"""
+    async def get_recent_releases(
+        self, repo_name: str, days: int = 30, since: Optional[datetime] = None
+    ) -> List[Dict]:
+        """Get recent releases from a repository, newer than ``since`` if given"""
         if not self.github:
             return []
 
-        try:
+        def _fetch_releases() -> List[Dict]:
             repo = self.github.get_repo(repo_name)
-            since = datetime.utcnow() - timedelta(days=days)
+            cutoff = since or datetime.utcnow() - timedelta(days=days)
 
             releases = []
             for release in repo.get_releases():
-                if release.created_at >= since:
+                if release.created_at >= cutoff:
                     releases.append(
                         {
                             "tag_name": release.tag_name,
@@ -113,12 +137,17 @@ class GitHubClient:
                             "assets": [asset.name for asset in release.assets],
                         }
                     )
+                    if len(releases) >= 10:  # Limit to 10 releases
+                        break
 
-            return releases[:10]  # Limit to 10 releases
+            return releases
+
+        try:
+            return await asyncio.to_thread(_fetch_releases)
 
         except Exception as e:
             logger.error(f"Failed to get releases for {repo_name}: {e}")
-            return []
+            raise
 
     async def search_repositories(
         self, query: str, language: str = "typescript"
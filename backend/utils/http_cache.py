@@ -0,0 +1,28 @@
+"""
+HTTP conditional request helpers for AICA-SyS
+"""
+
+import hashlib
+from typing import Dict, Mapping, Optional
+
+import aiohttp
+
+
+def conditional_headers(validators: Optional[Mapping[str, Optional[str]]]) -> Dict:
+    """Build If-None-Match / If-Modified-Since headers from cached validators"""
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def response_validators(response: aiohttp.ClientResponse, body: bytes) -> Dict:
+    """Extract cache validators and a content hash from a fetched response"""
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "content_hash": hashlib.sha256(body).hexdigest(),
+    }
@@ -4,11 +4,14 @@ RSS parser for AICA-SyS
 
 import asyncio
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
 import aiohttp
 import feedparser
+from selectolax.lexbor import LexborHTMLParser
+
+from .http_cache import conditional_headers, response_validators
 
 logger = logging.getLogger(__name__)
 
@@ -27,47 +30,81 @@ class RSSParser:
         if self.session:
             await self.session.close()
 
-    async def parse_feed(self, feed_url: str) -> Dict:
-        """Parse RSS/Atom feed from URL"""
+    async def parse_feed(
+        self,
+        feed_url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        validators: Optional[Dict] = None,
+    ) -> Dict:
+        """Parse RSS/Atom feed from URL
+
+        A shared ``session`` lets callers pool connections across feeds;
+        without one a short-lived session is opened for this request.
+        When cached ``validators`` are given the request is conditional and
+        an unchanged feed comes back as ``{"entries": [], "not_modified": True}``.
+        Fresh responses carry their own validators under ``"validators"``.
+        """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(feed_url) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        feed = feedparser.parse(content)
-
-                        return {
-                            "title": feed.feed.get("title", ""),
-                            "description": feed.feed.get("description", ""),
-                            "link": feed.feed.get("link", ""),
-                            "entries": [
-                                {
-                                    "title": entry.get("title", ""),
-                                    "link": entry.get("link", ""),
-                                    "description": entry.get("description", ""),
-                                    "summary": entry.get("summary", ""),
-                                    "published": entry.get("published", ""),
-                                    "tags": [tag.term for tag in entry.get("tags", [])],
-                                    "author": entry.get("author", ""),
-                                    "content": (
-                                        entry.get("content", [{}])[0].get("value", "")
-                                        if entry.get("content")
-                                        else ""
-                                    ),
-                                }
-                                for entry in feed.entries
-                            ],
-                        }
-                    else:
-                        logger.error(
-                            f"Failed to fetch feed {feed_url}: {response.status}"
-                        )
-                        return {"entries": []}
+            session = session or self.session
+            if session is None:
+                async with aiohttp.ClientSession() as own_session:
+                    return await self._fetch_feed(own_session, feed_url, validators)
+            return await self._fetch_feed(session, feed_url, validators)
 
         except Exception as e:
             logger.error(f"Failed to parse feed {feed_url}: {e}")
             return {"entries": []}
 
+    async def _fetch_feed(
+        self,
+        session: aiohttp.ClientSession,
+        feed_url: str,
+        validators: Optional[Dict] = None,
+    ) -> Dict:
+        """Download a feed and parse it off the event loop"""
+        async with session.get(
+            feed_url, headers=conditional_headers(validators)
+        ) as response:
+            if response.status == 304:
+                return {"entries": [], "not_modified": True}
+            if response.status != 200:
+                logger.error(f"Failed to fetch feed {feed_url}: {response.status}")
+                return {"entries": []}
+
+            content = await response.read()
+            fetched = response_validators(response, content)
+
+        feed = await asyncio.to_thread(self._parse_feed_content, content)
+        feed["validators"] = fetched
+        return feed
+
+    def _parse_feed_content(self, content: bytes) -> Dict:
+        """Parse raw feed bytes into the normalized feed dictionary"""
+        feed = feedparser.parse(content)
+
+        return {
+            "title": feed.feed.get("title", ""),
+            "description": feed.feed.get("description", ""),
+            "link": feed.feed.get("link", ""),
+            "entries": [
+                {
+                    "title": entry.get("title", ""),
+                    "link": entry.get("link", ""),
+                    "description": entry.get("description", ""),
+                    "summary": entry.get("summary", ""),
+                    "published": entry.get("published", ""),
+                    "tags": [tag.term for tag in entry.get("tags", [])],
+                    "author": entry.get("author", ""),
+                    "content": (
+                        entry.get("content", [{}])[0].get("value", "")
+                        if entry.get("content")
+                        else ""
+                    ),
+                }
+                for entry in feed.entries
+            ],
+        }
+
     async def parse_multiple_feeds(self, feed_urls: List[str]) -> List[Dict]:
         """Parse multiple RSS feeds concurrently"""
         tasks = [self.parse_feed(url) for url in feed_urls]
@@ -129,9 +166,6 @@ class RSSParser:
 
         # Clean up HTML if present
         if content and "<" in content:
-            from bs4 import BeautifulSoup
-
-            soup = BeautifulSoup(content, "html.parser")
-            content = soup.get_text()
+            content = LexborHTMLParser(content).text()
 
         return content.strip()
@@ -8,10 +8,21 @@ from typing import Dict, List, Optional
 from urllib.parse import urljoin, urlparse
 
 import aiohttp
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
+
+from .http_cache import conditional_headers, response_validators
 
 logger = logging.getLogger(__name__)
 
+# Candidate main content containers, in order of preference
+MAIN_CONTENT_SELECTORS = (
+    "main",
+    "article",
+    "div.content",
+    "div.post-content",
+    "div.entry-content",
+)
+
 
 class WebScraper:
     """Web scraper for collecting content from websites"""
@@ -30,22 +41,54 @@ class WebScraper:
         if self.session:
             await self.session.close()
 
-    async def scrape_url(self, url: str) -> Optional[Dict]:
-        """Scrape content from a single URL"""
+    async def scrape_url(
+        self,
+        url: str,
+        session: Optional[aiohttp.ClientSession] = None,
+        validators: Optional[Dict] = None,
+    ) -> Optional[Dict]:
+        """Scrape content from a single URL
+
+        A shared ``session`` lets callers pool connections across pages;
+        without one a short-lived session is opened for this request.
+        When cached ``validators`` are given the request is conditional and
+        an unchanged page returns ``None``. Fresh responses carry their own
+        validators under ``"validators"``.
+        """
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        return await self._parse_html(html, url)
-                    else:
-                        logger.error(f"Failed to fetch {url}: {response.status}")
-                        return None
+            session = session or self.session
+            if session is None:
+                async with aiohttp.ClientSession(headers=self.headers) as own_session:
+                    return await self._fetch_page(own_session, url, validators)
+            return await self._fetch_page(session, url, validators)
 
         except Exception as e:
             logger.error(f"Failed to scrape {url}: {e}")
             return None
 
+    async def _fetch_page(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        validators: Optional[Dict] = None,
+    ) -> Optional[Dict]:
+        """Download a page and parse its HTML"""
+        headers = {**self.headers, **conditional_headers(validators)}
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                return None
+            if response.status != 200:
+                logger.error(f"Failed to fetch {url}: {response.status}")
+                return None
+
+            body = await response.read()
+            fetched = response_validators(response, body)
+            html = body.decode(response.get_encoding(), errors="replace")
+
+        page = await asyncio.to_thread(self._parse_html, html, url)
+        page["validators"] = fetched
+        return page
+
     async def scrape_multiple_urls(self, urls: List[str]) -> List[Dict]:
         """Scrape multiple URLs concurrently"""
         tasks = [self.scrape_url(url) for url in urls]
@@ -61,63 +104,61 @@ class WebScraper:
 
         return valid_results
 
-    async def _parse_html(self, html: str, url: str) -> Dict:
-        """Parse HTML content and extract relevant information"""
-        soup = BeautifulSoup(html, "html.parser")
+    def _parse_html(self, html: str, url: str) -> Dict:
+        """Parse HTML content and extract relevant information
+
+        Parsing is CPU-bound, so callers run this in a worker thread.
+        """
+        tree = LexborHTMLParser(html)
 
         # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        tree.strip_tags(["script", "style"])
 
         # Extract title
         title = ""
-        title_tag = soup.find("title")
+        title_tag = tree.css_first("title")
         if title_tag:
-            title = title_tag.get_text().strip()
+            title = title_tag.text().strip()
 
         # Extract meta description
         description = ""
-        meta_desc = soup.find("meta", attrs={"name": "description"})
+        meta_desc = tree.css_first('meta[name="description"]')
         if meta_desc:
-            description = meta_desc.get("content", "").strip()
+            description = (meta_desc.attributes.get("content") or "").strip()
 
         # Extract main content
         content = ""
 
         # Try to find main content area
-        main_content = (
-            soup.find("main")
-            or soup.find("article")
-            or soup.find("div", class_="content")
-            or soup.find("div", class_="post-content")
-            or soup.find("div", class_="entry-content")
-        )
+        main_content = None
+        for selector in MAIN_CONTENT_SELECTORS:
+            main_content = tree.css_first(selector)
+            if main_content:
+                break
 
         if main_content:
-            content = main_content.get_text(separator=" ", strip=True)
-        else:
+            content = main_content.text(separator=" ", strip=True)
+        elif tree.body:
             # Fallback to body content
-            body = soup.find("body")
-            if body:
-                content = body.get_text(separator=" ", strip=True)
+            content = tree.body.text(separator=" ", strip=True)
 
         # Extract links
         links = []
-        for link in soup.find_all("a", href=True):
-            href = link.get("href")
+        for link in tree.css("a[href]"):
+            href = link.attributes.get("href")
             if href:
                 full_url = urljoin(url, href)
-                link_text = link.get_text().strip()
+                link_text = link.text().strip()
                 if link_text and len(link_text) < 100:  # Reasonable link text length
                     links.append({"url": full_url, "text": link_text})
 
         # Extract images
         images = []
-        for img in soup.find_all("img", src=True):
-            src = img.get("src")
+        for img in tree.css("img[src]"):
+            src = img.attributes.get("src")
             if src:
                 full_url = urljoin(url, src)
-                alt_text = img.get("alt", "")
+                alt_text = img.attributes.get("alt") or ""
                 images.append({"url": full_url, "alt": alt_text})
 
         return {